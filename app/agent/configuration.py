@@ -13,6 +13,11 @@ class Configuration(BaseModel):
     max_structured_output_retries: int = Field(default=3)
     allow_clarification: bool = Field(default=False)  # 빠른 시작을 위해 False
     max_concurrent_research_units: int = Field(default=3)  # 병렬 연구 최대 3개 (속도 향상!)
+    max_research_waves_per_turn: int = Field(default=2)  # 병렬 한도 초과 시 한 턴에서 추가로 실행할 wave 수 (최악 지연 제한)
+    
+    # 주제 이탈 사전 차단 (LLM 호출 전 글자 없는 입력 거부 - 이모지/URL만, 첫 질문에만 적용)
+    enable_offtopic_precheck: bool = Field(default=True)
+    clarify_message_window: int = Field(default=10)  # 주제 검증/인사 멘트 프롬프트에 넣을 최근 메시지 수 (0이면 전체)
     
     # 연구 설정
     max_researcher_iterations: int = Field(default=1)  # 1회 반복
@@ -31,6 +36,12 @@ class Configuration(BaseModel):
     # 검색 설정
     search_max_results: int = Field(default=5)  # 결과 5개 (정확도↑)
     search_depth: str = Field(default="advanced")  # advanced (정확도↑)
+    max_concurrent_searches: int = Field(default=3)  # 연구원 한 턴의 검색 tool call 동시 실행 수 (rate limit 방지)
+    enable_cold_start_bypass: bool = Field(default=False)  # 연구원 첫 턴(도메인 미지정)에 LLM 없이 vector_search부터 실행
+    
+    # Vector DB 검색 설정
+    vector_search_score_threshold: float = Field(default=0.75)  # 최소 유사도 (낮추면 관련 없는 결과 증가)
+    vector_search_hnsw_ef: int = Field(default=128)  # HNSW 탐색 폭 (임계값 대신 이 값으로 재현율 조정)
     
     @classmethod
     def from_runnable_config(
@@ -0,0 +1,87 @@
+"""노드 공용 L0 캐시 - Redis / 벡터 DB 조회 앞단의 프로세스 내 캐시"""
+
+from typing import Any, Dict, List, Optional
+
+from app.tools.cache import LocalTTLCache, research_cache
+from app.tools.search import searcher
+from app.tools.vector_store import vector_store
+
+# 최종 답변: (캐시키, 도메인, prefix) → Redis 값
+_final_lru = LocalTTLCache(maxsize=512, ttl_seconds=60)
+# 유사 질문: (질문, 도메인, 임계값) → 벡터 검색 결과
+_vector_lru = LocalTTLCache(maxsize=512, ttl_seconds=120)
+# 유사 질문 검색 단계 전체 결과: (정규화 캐시키, 도메인) → 최종 선택된 유사 질문
+# 같은 의미의 질문이 반복되면 원본/정규화/낮은 임계값 재시도 검색을 모두 건너뜀
+similar_by_cache_key = LocalTTLCache(maxsize=512, ttl_seconds=60)
+# Facts 검색: (쿼리, limit, 임계값, HNSW ef, vector_store.version) → 검색 결과
+# add_facts가 성공하면 version이 바뀌므로 새로 저장된 facts가 바로 반영됨
+_facts_lru = LocalTTLCache(maxsize=256, ttl_seconds=60)
+# 웹 검색: (쿼리, max_results, 검색 깊이, 교차 검증 여부) → searcher.search 결과 (빠른 재시도 흡수용)
+_web_search_lru = LocalTTLCache(maxsize=256, ttl_seconds=30)
+
+
+def cached_research_get(query: str, domain: str = "general", prefix: str = "answer") -> Optional[Dict[str, Any]]:
+    """research_cache.get 앞에 L0 캐시를 둔 조회 (HIT만 저장)"""
+    key = (query, domain, prefix)
+    value = _final_lru.get(key)
+    if value is not None:
+        return value
+    value = research_cache.get(query, domain=domain, prefix=prefix)
+    if value:
+        _final_lru.set(key, value)
+    return value
+
+
+def cached_similar_query(query: str, domain: str = "general", score_threshold: float = 0.70) -> Optional[Dict[str, Any]]:
+    """vector_store.search_similar_query 앞에 L0 캐시를 둔 조회 (HIT만 저장)"""
+    key = (query, domain, score_threshold)
+    value = _vector_lru.get(key)
+    if value is not None:
+        return value
+    value = vector_store.search_similar_query(
+        query=query,
+        domain=domain,
+        limit=1,
+        score_threshold=score_threshold,
+    )
+    if value:
+        _vector_lru.set(key, value)
+    return value
+
+
+def cached_search_facts(
+    query: str,
+    limit: int = 5,
+    score_threshold: float = 0.75,
+    hnsw_ef: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """vector_store.search_facts 앞에 L0 캐시를 둔 조회 (빈 결과도 저장, 버전 변경 시 무효화)"""
+    key = (query, limit, score_threshold, hnsw_ef, vector_store.version)
+    value = _facts_lru.get(key)
+    if value is not None:
+        return value
+    value = vector_store.search_facts(query, limit=limit, score_threshold=score_threshold, hnsw_ef=hnsw_ef)
+    _facts_lru.set(key, value)
+    return value
+
+
+async def cached_web_search(
+    query: str,
+    max_results: int = 5,
+    search_depth: str = "advanced",
+    enable_verification: bool = True,
+) -> Dict[str, Any]:
+    """searcher.search 앞에 L0 캐시를 둔 웹 검색 (성공 결과만 저장)"""
+    key = (query, max_results, search_depth, enable_verification)
+    value = _web_search_lru.get(key)
+    if value is not None:
+        return value
+    value = await searcher.search(
+        query=query,
+        max_results=max_results,
+        search_depth=search_depth,
+        enable_verification=enable_verification,
+    )
+    if value.get("success"):
+        _web_search_lru.set(key, value)
+    return value
@@ -32,6 +32,7 @@ from app.agent.decision import DecisionEngine
 from app.agent.fact_extractor import extract_tool_facts
 from app.agent.prompts import (
     DOMAIN_GUIDES,
+    format_domain_guide,
     clarify_with_user_instructions,
     transform_messages_into_research_topic_prompt,
     lead_researcher_prompt,
@@ -42,6 +43,7 @@ from app.agent.prompts import (
     get_today_str,
     get_current_year,
     get_current_month_year,
+    get_date_context,
 )
 from app.agent.utils import (
     think_tool,
@@ -52,9 +54,22 @@ from app.tools.search import searcher
 from app.tools.vector_store import vector_store
 from app.tools.query_normalizer import query_normalizer
 from app.tools.cache import research_cache
+from app.agent.nodes._caches import (
+    cached_research_get,
+    cached_similar_query,
+    similar_by_cache_key,
+    cached_search_facts,
+    cached_web_search,
+)
 
 # 설정 가능한 모델
 configurable_model = init_chat_model(
     configurable_fields=("model", "max_tokens", "api_key"),
 )
 
+
+def cancel_tasks(*tasks) -> None:
+    """더 이상 필요 없는 백그라운드 태스크 취소 (None/이미 끝난 태스크는 무시)"""
+    for task in tasks:
+        if task is not None:
+            task.cancel()
@@ -1,5 +1,7 @@
 """Decision Engine 실행 노드 - run_decision_engine"""
 
+import asyncio
+import logging
 import re
 from datetime import datetime
 
@@ -15,6 +17,17 @@ from app.agent.nodes._common import (
     WorkflowType,
 )
 
+logger = logging.getLogger(__name__)
+
+# 예산 패턴: "월 $100", "월 100"이 최우선, 없으면 "$100까지", "100 가능", "100 이하", "100 이내" 순
+_BUDGET_MONTHLY_RE = re.compile(r'월\s*\$?\s*(\d+)')
+_BUDGET_LIMIT_RE = re.compile(r'\$?\s*(\d+)\s*(까지|가능|이하|이내)')
+# 한도 표현 우선순위 (값이 작을수록 우선, 같은 표현이면 먼저 나온 것)
+_BUDGET_LIMIT_PRIORITY = {"까지": 0, "가능": 1, "이하": 2, "이내": 3}
+
+# 메시지 필터용 클래스 (HumanMessage는 서브클래스 없이 생성되므로 isinstance 대신 identity 비교)
+_HumanCls = HumanMessage
+
 
 async def run_decision_engine(state: AgentState, config: RunnableConfig):
     """Decision Engine 실행 (의사결정 질문인 경우)"""
@@ -47,34 +60,41 @@ async def run_decision_engine(state: AgentState, config: RunnableConfig):
     budget_max = constraints.get("budget_max") if constraints else None
     
     # 🚨 전체 사용자 메시지 히스토리에서 정보 추출 (HumanMessage만)
-    human_messages = [msg for msg in messages_list if isinstance(msg, HumanMessage)]
+    human_messages = [msg for msg in messages_list if msg.__class__ is _HumanCls]
     all_user_messages_text = " ".join([str(msg.content).lower() for msg in human_messages])
     
-    # 팀 규모 추출 시도 (전체 히스토리에서)
+    # 팀 규모/예산은 전체 히스토리에서 한 번만 추출 (UserContext 생성 시 재사용)
+    extracted_team_size = None
+    extracted_budget_max = None
+    if all_user_messages_text:
+        # "X명" 패턴 찾기
+        team_size_match = re.search(r'(\d+)\s*명', all_user_messages_text)
+        if team_size_match:
+            extracted_team_size = int(team_size_match.group(1))
+        
+        # 예산 추출 (월 $XXX, $XXX까지, XXX 이하 등)
+        # "월" 패턴을 먼저 한 번, 없으면 한도 표현들을 한 번의 스캔으로 찾아 우선순위가 가장 높은 것 사용
+        budget_match = _BUDGET_MONTHLY_RE.search(all_user_messages_text)
+        if budget_match is None:
+            budget_match = min(
+                _BUDGET_LIMIT_RE.finditer(all_user_messages_text),
+                key=lambda m: (_BUDGET_LIMIT_PRIORITY[m.group(2)], m.start()),
+                default=None,
+            )
+        if budget_match:
+            extracted_budget_max = float(budget_match.group(1))
+    
+    # 팀 규모 (constraints 우선, 없으면 전체 히스토리에서 추출한 값)
     if not team_size and all_user_messages_text:
         # "개인", "개인 개발자", "개인 사용자" 등을 인식하여 team_size = 1로 설정
         if any(keyword in all_user_messages_text for keyword in ["개인", "개인 개발자", "개인 사용자", "개인용", "개인으로"]):
             team_size = 1
-        else:
-            # "X명" 패턴 찾기
-            team_size_match = re.search(r'(\d+)\s*명', all_user_messages_text)
-            if team_size_match:
-                team_size = int(team_size_match.group(1))
+        elif extracted_team_size is not None:
+            team_size = extracted_team_size
     
-    # 예산 추출 시도 (전체 히스토리에서)
-    if not budget_max and all_user_messages_text:
-        budget_patterns = [
-            r'월\s*\$?\s*(\d+)',
-            r'\$?\s*(\d+)\s*까지',
-            r'\$?\s*(\d+)\s*가능',
-            r'\$?\s*(\d+)\s*이하',
-            r'\$?\s*(\d+)\s*이내',
-        ]
-        for pattern in budget_patterns:
-            budget_match = re.search(pattern, all_user_messages_text)
-            if budget_match:
-                budget_max = float(budget_match.group(1))
-                break
+    # 예산 (constraints 우선, 없으면 전체 히스토리에서 추출한 값)
+    if not budget_max and extracted_budget_max is not None:
+        budget_max = extracted_budget_max
     
     # 개발 언어/분야 확인 (제약 조건이 없어도 개발 언어/분야가 있으면 충분!)
     has_development_area = False
@@ -128,7 +148,10 @@ async def run_decision_engine(state: AgentState, config: RunnableConfig):
     )
     
     if not has_sufficient_info:
-        print(f"⚡ [Decision Engine] 정보 부족 (너무 모호) - 빠른 반환 (team_size: {team_size}, budget_max: {budget_max}, dev_area: {has_development_area}, is_too_vague: {is_too_vague})")
+        logger.debug(
+            "⚡ [Decision Engine] 정보 부족 (너무 모호) - 빠른 반환 (team_size: %s, budget_max: %s, dev_area: %s, is_too_vague: %s)",
+            team_size, budget_max, has_development_area, is_too_vague,
+        )
         return {}  # route_after_research에서 clarify_missing_constraints로 라우팅
     
     # 제약 조건이 충분하면 tool_facts 추출 및 Decision Engine 실행
@@ -136,61 +159,25 @@ async def run_decision_engine(state: AgentState, config: RunnableConfig):
     findings = "\n\n".join(notes)
     tool_facts = state.get("tool_facts", [])
     
-    print(f"🔍 [Decision Engine DEBUG] is_decision_question: {is_decision_question}, tool_facts: {len(tool_facts) if tool_facts else 0}개")
-    print(f"🔍 [Decision Engine DEBUG] findings 길이: {len(findings) if findings else 0}자")
+    logger.debug("🔍 [Decision Engine] is_decision_question: %s, tool_facts: %d개", is_decision_question, len(tool_facts) if tool_facts else 0)
+    logger.debug("🔍 [Decision Engine] findings 길이: %d자", len(findings))
     
     # Findings가 있으면 tool_facts 추출 시도 (최소 길이 50자로 완화)
+    # LLM 호출은 태스크로 먼저 시작하고, 응답을 기다리는 동안 UserContext를 구성
+    extract_task = None
     if not tool_facts and findings and len(findings.strip()) >= 50:
-        print(f"🔍 [Fact Extractor] Findings에서 도구 사실 추출 시작 (Findings 길이: {len(findings)}자)")
-        try:
-            extracted_facts = await extract_tool_facts(findings, config, max_retries=3)
-            if extracted_facts:
-                tool_facts = [fact.model_dump() for fact in extracted_facts]
-                print(f"✅ [Fact Extractor] {len(tool_facts)}개 도구 사실 추출 완료")
-                state["tool_facts"] = tool_facts
-            else:
-                print(f"⚠️ [Fact Extractor] 도구 사실 추출 실패 (Findings 길이: {len(findings)}자)")
-        except Exception as e:
-            print(f"⚠️ [Fact Extractor] 오류: {e}")
-            import traceback
-            traceback.print_exc()
-    
-    # 🚨 Decision 질문인데 tool_facts가 없으면 Findings에서 다시 추출 시도 (더 적극적으로)
-    if is_decision_question and not tool_facts:
-        if findings and len(findings.strip()) >= 50:
-            print(f"🔍 [Decision Engine] tool_facts 없음 - Findings에서 재추출 시도 (Findings 길이: {len(findings)}자)")
-            try:
-                # 재시도 시 더 긴 max_tokens로 시도 (더 많은 컨텍스트 활용)
-                extracted_facts = await extract_tool_facts(findings, config, max_retries=3)
-                if extracted_facts:
-                    tool_facts = [fact.model_dump() for fact in extracted_facts]
-                    print(f"✅ [Decision Engine] 재추출 성공: {len(tool_facts)}개 도구 사실")
-                    state["tool_facts"] = tool_facts
-                else:
-                    print(f"⚠️ [Decision Engine] tool_facts 추출 실패 - Findings에서 도구 정보를 찾을 수 없음 (Findings 길이: {len(findings)}자)")
-                    print(f"🔍 [Decision Engine] Findings 샘플 (처음 500자): {findings[:500]}")
-            except Exception as e:
-                print(f"⚠️ [Decision Engine] tool_facts 추출 오류: {e}")
-                import traceback
-                traceback.print_exc()
-        else:
-            print(f"⚠️ [Decision Engine] findings가 부족함 ({len(findings) if findings else 0}자, 최소 50자 필요)")
+        logger.debug("🔍 [Fact Extractor] Findings에서 도구 사실 추출 시작 (Findings 길이: %d자)", len(findings))
+        extract_task = asyncio.create_task(extract_tool_facts(findings, config, max_retries=3))
+        # 태스크가 요청을 보낼 때까지 한 번 양보 (이후 동기 작업과 LLM 대기가 겹침)
+        await asyncio.sleep(0)
     
-    if not tool_facts:
-        # Decision 질문인데 tool_facts가 없으면 Decision Engine 실행 불가
-        print(f"🚨 [Decision Engine] Decision 질문이지만 tool_facts 없음 - Decision Engine 실행 불가")
-        # 🚨 중요: tool_facts가 없으면 decision_result도 없으므로 route_after_research에서 cannot_answer로 감
-        # 하지만 사용자가 일반 리포트를 원할 수 있으므로, 빈 dict 반환하여 route_after_research에서 처리하도록 함
-        return {}
-    
-    # Decision Engine 실행
+    # UserContext 생성 (Findings/tool_facts와 무관하므로 추출 결과를 기다리기 전에 계산)
     try:
-        constraints = state.get("constraints", {})
         tech_stack = constraints.get("must_support_language", []) if constraints else []
         
         if not tech_stack and messages_list:
             # HumanMessage만 찾아서 사용자 메시지 확인
-            human_messages = [msg for msg in messages_list if isinstance(msg, HumanMessage)]
+            human_messages = [msg for msg in messages_list if msg.__class__ is _HumanCls]
             if human_messages:
                 last_user_msg = str(human_messages[-1].content).lower()
             else:
@@ -261,7 +248,7 @@ async def run_decision_engine(state: AgentState, config: RunnableConfig):
         workflow_focus = []
         if messages_list:
             # 모든 HumanMessage에서 키워드 확인 (최신 메시지 우선)
-            human_messages = [msg for msg in messages_list if isinstance(msg, HumanMessage)]
+            human_messages = [msg for msg in messages_list if msg.__class__ is _HumanCls]
             if human_messages:
                 # 모든 사용자 메시지를 합쳐서 확인 (최신 메시지가 우선이지만 이전 맥락도 참고)
                 all_user_text = " ".join([str(msg.content).lower() for msg in human_messages])
@@ -307,39 +294,10 @@ async def run_decision_engine(state: AgentState, config: RunnableConfig):
                 # 점수 계산에서 workflow_focus가 비어있으면 높은 점수 부여하도록 되어 있음
                 pass
         
-        # UserContext 생성
-        current_team_size = None
-        current_budget_max = None
+        # UserContext 생성 (팀 규모/예산은 위에서 전체 히스토리로 추출한 값 재사용)
         current_required_integrations = []
         
-        if messages_list:
-            # HumanMessage만 찾아서 사용자 메시지 확인
-            human_messages = [msg for msg in messages_list if isinstance(msg, HumanMessage)]
-            if human_messages:
-                all_user_text = " ".join([str(msg.content) for msg in human_messages])
-                last_user_msg = all_user_text.lower()
-            else:
-                last_user_msg = ""
-            
-            # 팀 규모 추출
-            team_size_match = re.search(r'(\d+)\s*명', last_user_msg)
-            if team_size_match:
-                current_team_size = int(team_size_match.group(1))
-            
-            # 예산 추출 (월 $XXX, $XXX/월, 월 XXX달러 등)
-            budget_patterns = [
-                r'월\s*\$?\s*(\d+)',  # "월 $100", "월 100"
-                r'\$?\s*(\d+)\s*까지',  # "$100까지", "100까지"
-                r'\$?\s*(\d+)\s*가능',  # "$100 가능", "100 가능"
-                r'\$?\s*(\d+)\s*이하',  # "$100 이하", "100 이하"
-                r'\$?\s*(\d+)\s*이내',  # "$100 이내", "100 이내"
-            ]
-            for pattern in budget_patterns:
-                budget_match = re.search(pattern, last_user_msg)
-                if budget_match:
-                    current_budget_max = float(budget_match.group(1))
-                    break
-            
+        if all_user_messages_text:
             # 통합 기능 추출 (GitHub, GitLab, Slack 등)
             integration_keywords = {
                 "github": "GitHub",
@@ -352,13 +310,13 @@ async def run_decision_engine(state: AgentState, config: RunnableConfig):
                 "notion": "Notion",
             }
             for keyword, integration_name in integration_keywords.items():
-                if keyword in last_user_msg:
+                if keyword in all_user_messages_text:
                     if integration_name not in current_required_integrations:
                         current_required_integrations.append(integration_name)
         
         # constraints에서 가져온 값이 없으면 메시지에서 추출한 값 사용
-        final_team_size = current_team_size or (constraints.get("team_size") if constraints else None)
-        final_budget_max = current_budget_max or (constraints.get("budget_max") if constraints else None)
+        final_team_size = extracted_team_size or (constraints.get("team_size") if constraints else None)
+        final_budget_max = extracted_budget_max or (constraints.get("budget_max") if constraints else None)
         final_required_integrations = current_required_integrations or (constraints.get("required_integrations", []) if constraints else [])
         
         user_context = UserContext(
@@ -370,35 +328,96 @@ async def run_decision_engine(state: AgentState, config: RunnableConfig):
             workflow_focus=workflow_focus,
             excluded_tools=constraints.get("excluded_tools", []) if constraints else []
         )
-        
-        # 🚨 상세 디버깅 로그: 입력 State 출력
-        print("=" * 80)
-        print("🔍 [Decision Engine INPUT]")
-        print(f"  team_size: {final_team_size} (메시지: {current_team_size}, constraints: {constraints.get('team_size') if constraints else None})")
-        print(f"  tech_stack: {tech_stack}")
-        print(f"  budget_max: {final_budget_max} (메시지: {current_budget_max}, constraints: {constraints.get('budget_max') if constraints else None})")
-        print(f"  security_required: {constraints.get('security_required', False) if constraints else False}")
-        print(f"  required_integrations: {final_required_integrations} (메시지: {current_required_integrations})")
-        print(f"  workflow_focus: {[w.value for w in workflow_focus]}")
-        print(f"  excluded_tools: {constraints.get('excluded_tools', []) if constraints else []}")
-        print(f"  tool_facts 개수: {len(tool_facts)}개")
-        if tool_facts:
-            print(f"  tool_facts 도구명: {[fact.get('name', 'Unknown') for fact in tool_facts[:5]]}")
-        print("=" * 80)
+    except Exception as e:
+        if extract_task is not None:
+            extract_task.cancel()
+        logger.exception("⚠️ [Decision Engine] 오류: %s", e)
+        return {}
+    
+    if extract_task is not None:
+        try:
+            extracted_facts = await extract_task
+            if extracted_facts:
+                tool_facts = [fact.model_dump() for fact in extracted_facts]
+                logger.debug("✅ [Fact Extractor] %d개 도구 사실 추출 완료", len(tool_facts))
+                state["tool_facts"] = tool_facts
+            else:
+                logger.warning("⚠️ [Fact Extractor] 도구 사실 추출 실패 (Findings 길이: %d자)", len(findings))
+        except Exception as e:
+            logger.warning("⚠️ [Fact Extractor] 오류: %s", e, exc_info=True)
+    
+    # 🚨 Decision 질문인데 tool_facts가 없으면 Findings에서 다시 추출 시도 (더 적극적으로)
+    if is_decision_question and not tool_facts:
+        if findings and len(findings.strip()) >= 50:
+            logger.debug("🔍 [Decision Engine] tool_facts 없음 - Findings에서 재추출 시도 (Findings 길이: %d자)", len(findings))
+            try:
+                # 재시도 시 더 긴 max_tokens로 시도 (더 많은 컨텍스트 활용)
+                extracted_facts = await extract_tool_facts(findings, config, max_retries=3)
+                if extracted_facts:
+                    tool_facts = [fact.model_dump() for fact in extracted_facts]
+                    logger.debug("✅ [Decision Engine] 재추출 성공: %d개 도구 사실", len(tool_facts))
+                    state["tool_facts"] = tool_facts
+                else:
+                    logger.warning("⚠️ [Decision Engine] tool_facts 추출 실패 - Findings에서 도구 정보를 찾을 수 없음 (Findings 길이: %d자)", len(findings))
+                    # 샘플 슬라이스는 DEBUG 레벨에서만 만든다
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("🔍 [Decision Engine] Findings 샘플 (처음 500자): %s", findings[:500])
+            except Exception as e:
+                logger.warning("⚠️ [Decision Engine] tool_facts 추출 오류: %s", e, exc_info=True)
+        else:
+            logger.warning("⚠️ [Decision Engine] findings가 부족함 (%d자, 최소 50자 필요)", len(findings))
+    
+    if not tool_facts:
+        # Decision 질문인데 tool_facts가 없으면 Decision Engine 실행 불가
+        logger.warning("🚨 [Decision Engine] Decision 질문이지만 tool_facts 없음 - Decision Engine 실행 불가")
+        # 🚨 중요: tool_facts가 없으면 decision_result도 없으므로 route_after_research에서 cannot_answer로 감
+        # 하지만 사용자가 일반 리포트를 원할 수 있으므로, 빈 dict 반환하여 route_after_research에서 처리하도록 함
+        return {}
+    
+    # Decision Engine 실행
+    try:
+        # 🚨 상세 디버깅 로그: 입력 State 출력 (리스트 생성 비용이 있어 DEBUG 레벨에서만)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "🔍 [Decision Engine INPUT]\n"
+                "  team_size: %s (메시지: %s, constraints: %s)\n"
+                "  tech_stack: %s\n"
+                "  budget_max: %s (메시지: %s, constraints: %s)\n"
+                "  security_required: %s\n"
+                "  required_integrations: %s (메시지: %s)\n"
+                "  workflow_focus: %s\n"
+                "  excluded_tools: %s\n"
+                "  tool_facts 개수: %d개\n"
+                "  tool_facts 도구명: %s",
+                final_team_size, extracted_team_size, constraints.get("team_size") if constraints else None,
+                tech_stack,
+                final_budget_max, extracted_budget_max, constraints.get("budget_max") if constraints else None,
+                user_context.security_required,
+                final_required_integrations, current_required_integrations,
+                [w.value for w in workflow_focus],
+                user_context.excluded_tools,
+                len(tool_facts),
+                [fact.get("name", "Unknown") for fact in tool_facts[:5]],
+            )
         
         # Decision Engine 실행
         tools = [ToolFact(**fact) for fact in tool_facts]
         engine = DecisionEngine(user_context)
-        decision_result = engine.make_decision(tools)
+        # 점수 계산은 CPU 작업이므로 이벤트 루프를 막지 않도록 스레드에서 실행
+        # (DecisionEngine은 요청마다 새로 생성되어 공유 상태가 없음)
+        decision_result = await asyncio.to_thread(engine.make_decision, tools)
         
-        print(f"✅ [Decision Engine] 실행 완료: 추천 {len(decision_result.recommended_tools)}개, 제외 {len(decision_result.excluded_tools)}개")
+        logger.info(
+            "✅ [Decision Engine] 실행 완료: 추천 %d개, 제외 %d개",
+            len(decision_result.recommended_tools), len(decision_result.excluded_tools),
+        )
         
         # 🚨 Follow-up 질문인 경우 이전 추천 순서 유지
         previous_tools_ordered = state.get("previous_tools_ordered")
         decision_result_dict = decision_result.model_dump()
         
         if previous_tools_ordered and len(previous_tools_ordered) > 0:
-            print(f"🔍 [Decision Engine] 이전 추천 순서 확인: {previous_tools_ordered}")
+            logger.debug("🔍 [Decision Engine] 이전 추천 순서 확인: %s", previous_tools_ordered)
             
             # 이전 순서를 기준으로 추천 도구 재정렬
             recommended_tools = decision_result.recommended_tools
@@ -432,15 +451,13 @@ async def run_decision_engine(state: AgentState, config: RunnableConfig):
             # 재정렬된 도구 목록으로 DecisionResult 업데이트
             if reordered_tools:
                 decision_result_dict["recommended_tools"] = reordered_tools
-                print(f"✅ [Decision Engine] 이전 순서 적용: {reordered_tools}")
+                logger.debug("✅ [Decision Engine] 이전 순서 적용: %s", reordered_tools)
         
         return {
             "decision_result": decision_result_dict,
             "tool_facts": tool_facts  # tool_facts를 state에 저장하여 route_after_research에서 사용 가능하도록
         }
     except Exception as e:
-        print(f"⚠️ [Decision Engine] 오류: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("⚠️ [Decision Engine] 오류: %s", e)
         return {}
 
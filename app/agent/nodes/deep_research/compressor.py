@@ -15,6 +15,10 @@ from app.agent.nodes._common import (
     AIMessage,
 )
 
+# raw_notes 대상 메시지 클래스 (ToolMessage/AIMessage는 서브클래스 없이 생성되므로 identity 비교)
+_ToolCls = ToolMessage
+_AICls = AIMessage
+
 
 async def compress_research(state: ResearcherState, config: RunnableConfig):
     """연구 결과 압축"""
@@ -38,7 +42,7 @@ async def compress_research(state: ResearcherState, config: RunnableConfig):
         
         raw_notes = "\n".join([
             str(msg.content) for msg in researcher_messages
-            if isinstance(msg, (ToolMessage, AIMessage))
+            if msg.__class__ is _ToolCls or msg.__class__ is _AICls
         ])
         
         return {
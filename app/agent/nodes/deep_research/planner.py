@@ -1,5 +1,6 @@
 """연구 계획 수립 노드 - write_research_brief"""
 
+import logging
 import re
 from typing import Literal
 
@@ -13,17 +14,88 @@ from app.agent.nodes._common import (
     SystemMessage,
     get_buffer_string,
     configurable_model,
-    DOMAIN_GUIDES,
+    format_domain_guide,
     transform_messages_into_research_topic_prompt,
     lead_researcher_prompt,
-    get_today_str,
-    get_current_year,
-    get_current_month_year,
+    get_date_context,
     get_api_key_for_model,
     AIMessage,
 )
 
 
+logger = logging.getLogger(__name__)
+
+# 이전 AI 답변에서 추천 도구명을 추출하는 패턴 (메시지마다 반복 사용되므로 모듈 로드 시 한 번만 컴파일)
+# 패턴별로 따로 스캔: 📊 패턴은 줄 끝까지 소비하므로 하나의 alternation으로 합치면
+# 같은 줄의 N순위/대안 등 겹치는 매치가 누락됨 (대신 마커 문자열이 없는 패턴은 스캔 생략)
+# 뒤따르는 토큰과 겹치지 않는 문자 클래스 반복은 possessive(++, *+)로 두어 LLM 출력이 길어도 되돌아가기(backtracking)가 없음
+_RE_EMOJI_TOOL = re.compile(r'📊\s+([^\n]++)')                                   # 📊 [도구명]
+_RE_HEADER_TOOL = re.compile(r'##\s++📊\s+([^\n]++)')                            # ## 📊 [도구명]
+_RE_RANK = re.compile(r'\*\*([0-9]++)순위:\s*([^\*]++)\*\*')                      # **1순위: [도구명]**
+_RE_FINAL = re.compile(r'\*\*최종 추천:\s*([^\*]++)\*\*')                         # **최종 추천: [도구명]**
+_RE_RECOMMEND = re.compile(r'(?:가장\s++)?추천하는\s++도구:\s*([^\n\.]++)')       # (가장) 추천하는 도구: [도구명]
+_RE_ALT = re.compile(r'대안\s*+([0-9]++):\s*([^\n\.]++)')                          # 대안 1: [도구명]
+_RE_REC_SECTION = re.compile(r'💡[^\n]*(?:추천[^\n]*)', re.MULTILINE)
+_RE_BEST_RECOMMEND = re.compile(r'가장\s++추천하는\s++도구:\s*([^\n\.]++)')
+# 💡 추천 섹션에서 찾는 대표 도구명 (소문자 → 표준 표기)
+_KNOWN_TOOL_NAMES = {
+    name.lower(): name
+    for name in (
+        "GitHub Copilot", "Cursor", "Codeium", "Tabnine", "Aider", "Replit", "Cline",
+        "Windsurf", "CodeRabbit", "DeepCode", "JetBrains AI Assistant", "CodeAnt", "Qodo", "Codacy",
+    )
+}
+# 미리 소문자로 바꾼 섹션을 스캔 (re.IGNORECASE의 문자별 case-folding 비용 제거)
+_RE_TOOL_NAMES = re.compile(
+    r'\b(' + '|'.join(re.escape(name).replace(r'\ ', r'\s+') for name in _KNOWN_TOOL_NAMES) + r')\b'
+)
+# 정규식 \s 와 동일한 유니코드 공백 문자 전체 (U+00A0, U+3000 등 포함 - 최대값은 U+3000)
+_WS_CHARS = "".join(ch for ch in map(chr, range(0x3001)) if ch.isspace())
+# 도구명 뒤에 붙는 괄호/가격/공백 문자 (정규식 없이 str.rstrip으로 제거)
+_TRAIL = "()[]월$0123456789/" + _WS_CHARS
+_RE_WS = re.compile(r'\s+')
+# 중복 비교용 정제: 괄호/가격/공백 문자를 위치와 무관하게 모두 제거 (str.translate)
+_STRIP_TABLE = str.maketrans('', '', "()[]월$0123456789" + _WS_CHARS)
+
+# 추출 패턴 태그 (tools_with_order에 문자열 대신 정수로 기록)
+# 값이 곧 중복 제거 우선순위: 순서 정보가 명시된 rank/alternative가 먼저, 나머지는 동일 우선순위
+_P_RANK, _P_ALT, _P_EMOJI, _P_HEADER, _P_FINAL, _P_RECOMMEND, _P_REC_SECTION = range(7)
+_REST_PRIORITY = _P_EMOJI
+
+# 메시지 필터용 클래스 (isinstance 대신 identity 비교)
+_HumanCls = HumanMessage
+_AICls = AIMessage
+
+# Follow-up 도구 추출 범위: 최근 AI 답변 몇 개만 보고, 도구가 충분히 모이면 중단
+_MAX_PREVIOUS_AI_MESSAGES = 3
+_MAX_PREVIOUS_TOOLS = 10
+_MIN_TOOL_CONTENT_LENGTH = 20
+
+
+def _build_research_topic_prompt(
+    messages_list: list,
+    today: str,
+    current_year: str,
+    current_month_year: str,
+    domain: str,
+    formatted_domain_guide: str,
+    is_followup: bool,
+    previous_tools: str,
+) -> str:
+    """연구 주제 변환 프롬프트 생성 (대화 이력 직렬화 + 템플릿 포맷팅)"""
+    return transform_messages_into_research_topic_prompt.format(
+        messages=get_buffer_string(messages_list),
+        date=today,
+        current_year=current_year,
+        current_month_year=current_month_year,
+        domain=domain,
+        domain_guide=formatted_domain_guide,
+        is_followup="YES" if is_followup else "NO",
+        previous_tools=previous_tools if previous_tools else "없음",
+        question_type="comparison"  # 임시값, LLM이 판단한 값으로 대체됨
+    )
+
+
 async def write_research_brief(
     state: AgentState, config: RunnableConfig
 ) -> Command[Literal["research_supervisor"]]:
@@ -31,7 +103,6 @@ async def write_research_brief(
     
     configurable = Configuration.from_runnable_config(config)
     domain = state.get("domain", "AI 서비스")
-    domain_guide = DOMAIN_GUIDES.get(domain, "")
     
     research_model_config = {
         "model": configurable.research_model,
@@ -46,169 +117,161 @@ async def write_research_brief(
         .with_config(research_model_config)
     )
     
-    # domain_guide 포맷팅 (transform_messages에서도 사용)
-    try:
-        formatted_domain_guide_for_research = domain_guide.format(
-            date=get_today_str(),
-            current_year=get_current_year(),
-            current_month_year=get_current_month_year()
-        )
-    except KeyError:
-        formatted_domain_guide_for_research = domain_guide
+    # 날짜 정보는 한 번만 가져와 모든 프롬프트 포맷팅에 재사용 (분 단위 캐시)
+    today, current_year, current_month_year = get_date_context()
+    
+    # domain_guide 포맷팅 (transform_messages와 lead_researcher_prompt에서 공통 사용)
+    formatted_domain_guide = format_domain_guide(domain, today, current_year, current_month_year)
     
     # Messages 가져오기 및 Follow-up 판단
     messages_list = state.get("messages", [])
-    human_messages = [msg for msg in messages_list if isinstance(msg, HumanMessage)]
-    question_number = len(human_messages)
+    # 한 번의 순회로 사용자 질문 수 계산과 AI 메시지 수집을 함께 처리
+    question_number = 0
+    ai_messages = []
+    for msg in messages_list:
+        msg_cls = msg.__class__
+        if msg_cls is _HumanCls:
+            question_number += 1
+        elif msg_cls is _AICls:
+            ai_messages.append(msg)
     is_followup = question_number > 1
     
-    # 이전 도구 추출 (Follow-up인 경우) - 모든 AI 메시지에서 추출 (순서 유지)
+    # 이전 도구 추출 (Follow-up인 경우) - 최근 AI 메시지에서 추출 (순서 유지)
     previous_tools = ""
     previous_tools_ordered = []  # 순서 유지용 리스트
     if is_followup:
         all_tools = []
         tools_with_order = []  # 순서 정보 포함
+        candidate_names = set()  # 정제된 도구명 (조기 종료 판단용)
+        scanned_ai_messages = 0
         
-        for msg in reversed(messages_list[:-1]):  # 마지막 사용자 메시지 제외
-            if isinstance(msg, AIMessage) and hasattr(msg, 'content'):
-                content = str(msg.content)
-                # 다양한 패턴으로 도구명 추출 (순서 정보 포함)
+        # 최근 AI 메시지부터 최대 _MAX_PREVIOUS_AI_MESSAGES개만 스캔 (히스토리 길이와 무관하게 일정한 비용)
+        if ai_messages and ai_messages[-1] is messages_list[-1]:
+            ai_messages.pop()  # 마지막 메시지는 현재 질문이므로 제외
+        for msg in reversed(ai_messages):
+            content = str(msg.content)
+            # 짧은 응답(확인 메시지 등)에는 도구명이 있을 수 없으므로 패턴 스캔 생략
+            if len(content) < _MIN_TOOL_CONTENT_LENGTH:
+                continue
+            message_start = len(tools_with_order)
+            # 다양한 패턴으로 도구명 추출 (순서 정보 포함)
+            if "📊" in content:
                 # 패턴 1: 📊 [도구명] (순서대로 나타나는 순서 사용)
-                tools_found = re.findall(r'📊\s+([^\n]+)', content)
-                for idx, tool in enumerate(tools_found):
-                    if tool.strip():
-                        tools_with_order.append((tool.strip(), idx, "emoji"))
+                for idx, match in enumerate(_RE_EMOJI_TOOL.finditer(content)):
+                    tool = match.group(1).strip()
+                    if tool:
+                        tools_with_order.append((tool, idx, _P_EMOJI))
                 # 패턴 2: ## 📊 [도구명]
-                tools_found2 = re.findall(r'##\s+📊\s+([^\n]+)', content)
-                for idx, tool in enumerate(tools_found2):
-                    if tool.strip():
-                        tools_with_order.append((tool.strip(), idx, "header"))
-                # 패턴 3: **1순위: [도구명]**, **2순위: [도구명]** (순서 정보 명시)
-                tools_found3 = re.findall(r'\*\*([0-9]+)순위:\s*([^\*]+)\*\*', content)
-                for order_str, tool in tools_found3:
-                    if tool.strip():
-                        order = int(order_str) if order_str.isdigit() else 999
-                        tools_with_order.append((tool.strip(), order, "rank"))
-                # 패턴 4: **최종 추천: [도구명]**
-                tools_found4 = re.findall(r'\*\*최종 추천:\s*([^\*]+)\*\*', content)
-                for idx, tool in enumerate(tools_found4):
-                    if tool.strip():
-                        tools_with_order.append((tool.strip(), 0, "final"))
-                # 패턴 5: "가장 추천하는 도구: [도구명]" 또는 "추천하는 도구: [도구명]"
-                tools_found5 = re.findall(r'(?:가장\s+)?추천하는\s+도구:\s*([^\n\.]+)', content)
-                for idx, tool in enumerate(tools_found5):
-                    if tool.strip():
-                        # 불필요한 문자 제거 (괄호, 기타 특수문자)
-                        tool_clean = re.sub(r'[\(\)\[\]월\s\$0-9/]+$', '', tool.strip()).strip()
-                        if tool_clean and len(tool_clean) > 2:
-                            tools_with_order.append((tool_clean, 0, "recommended"))
-                # 패턴 5-1: "대안 1: [도구명]", "대안 2: [도구명]" 등
-                tools_found5_1 = re.findall(r'대안\s*([0-9]+):\s*([^\n\.]+)', content)
-                for order_str, tool in tools_found5_1:
-                    if tool.strip():
-                        order = int(order_str) if order_str.isdigit() else 999
-                        # 불필요한 문자 제거 (괄호, 기타 특수문자) - 하지만 도구명 자체는 보존
-                        tool_clean = re.sub(r'[\(\)\[\]월\s\$0-9/]+$', '', tool.strip()).strip()
-                        # 공백 정리 (여러 공백을 하나로)
-                        tool_clean = re.sub(r'\s+', ' ', tool_clean).strip()
-                        if tool_clean and len(tool_clean) > 2:
-                            tools_with_order.append((tool_clean, order, "alternative"))
-                # 패턴 6: "💡 추천 도구" 또는 "💡 맞춤 추천" 섹션의 도구명
-                # 💡 섹션에서 도구명 추출 (더 정확한 패턴)
-                if "💡" in content and "추천" in content:
-                    # 섹션 내에서 도구명 찾기 (더 구체적인 패턴)
-                    recommendation_section = re.search(r'💡[^\n]*(?:추천[^\n]*)', content, re.MULTILINE)
-                    if recommendation_section:
-                        section_content = recommendation_section.group(0)
-                        # "가장 추천하는 도구: [도구명]" 패턴 다시 확인
-                        tools_found6 = re.findall(r'가장\s+추천하는\s+도구:\s*([^\n\.]+)', section_content)
-                        for tool in tools_found6:
-                            tool_clean = re.sub(r'[\(\)\[\]월\s\$0-9/]+$', '', tool.strip()).strip()
-                            if tool_clean and len(tool_clean) > 2:
-                                tools_with_order.append((tool_clean, 0, "recommendation_section"))
-                        # GitHub Copilot, Cursor 같은 도구명 패턴 찾기 (섹션 내에서만)
-                        tool_names_in_recommendation = re.findall(r'\b(GitHub\s+Copilot|Cursor|Codeium|Tabnine|Aider|Replit|Cline|Windsurf|CodeRabbit|DeepCode|JetBrains\s+AI\s+Assistant|CodeAnt|Qodo|Codacy)\b', section_content, re.IGNORECASE)
-                        for tool_name in tool_names_in_recommendation:
-                            if tool_name.strip():
-                                tools_with_order.append((tool_name.strip(), 999, "recommendation_section"))
-        
-        # 도구명 정제 및 순서 유지
-        seen = set()
-        unique_tools = []
-        
-        # rank 패턴이 있으면 그것을 우선 사용 (순서 정보 명시)
-        ranked_tools = [(t, o) for t, o, p in tools_with_order if p == "rank"]
-        if ranked_tools:
-            ranked_tools.sort(key=lambda x: x[1])  # 순서대로 정렬
-            for tool, order in ranked_tools:
-                tool_clean = re.sub(r'[\(\)\[\]월\s\$0-9]+', '', tool).strip()
-                if tool_clean and tool_clean not in seen and len(tool_clean) > 2:
-                    seen.add(tool_clean)
-                    unique_tools.append(tool_clean)
-        
-        # alternative 패턴도 순서 정보가 있으므로 우선 처리
-        alternative_tools = [(t, o) for t, o, p in tools_with_order if p == "alternative"]
-        if alternative_tools:
-            alternative_tools.sort(key=lambda x: x[1])  # 순서대로 정렬
-            for tool, order in alternative_tools:
-                tool_clean = re.sub(r'[\(\)\[\]월\s\$0-9]+', '', tool).strip()
-                if tool_clean and tool_clean not in seen and len(tool_clean) > 2:
-                    seen.add(tool_clean)
-                    unique_tools.append(tool_clean)
+                if "##" in content:
+                    for idx, match in enumerate(_RE_HEADER_TOOL.finditer(content)):
+                        tool = match.group(1).strip()
+                        if tool:
+                            tools_with_order.append((tool, idx, _P_HEADER))
+            # 패턴 3: **1순위: [도구명]**, **2순위: [도구명]** (순서 정보 명시)
+            if "순위:" in content:
+                for match in _RE_RANK.finditer(content):
+                    tool = match.group(2).strip()
+                    if tool:
+                        tools_with_order.append((tool, int(match.group(1)), _P_RANK))
+            # 패턴 4: **최종 추천: [도구명]**
+            if "최종 추천:" in content:
+                for match in _RE_FINAL.finditer(content):
+                    tool = match.group(1).strip()
+                    if tool:
+                        tools_with_order.append((tool, 0, _P_FINAL))
+            # 패턴 5: "가장 추천하는 도구: [도구명]" 또는 "추천하는 도구: [도구명]"
+            if "추천하는" in content:
+                for match in _RE_RECOMMEND.finditer(content):
+                    # 불필요한 문자 제거 (괄호, 기타 특수문자) - strip은 후보당 한 번만
+                    tool_clean = match.group(1).strip().rstrip(_TRAIL)
+                    if len(tool_clean) > 2:
+                        tools_with_order.append((tool_clean, 0, _P_RECOMMEND))
+            # 패턴 5-1: "대안 1: [도구명]", "대안 2: [도구명]" 등
+            if "대안" in content:
+                for match in _RE_ALT.finditer(content):
+                    # 불필요한 문자 제거 (괄호, 기타 특수문자) - 하지만 도구명 자체는 보존
+                    tool_clean = match.group(2).strip().rstrip(_TRAIL)
+                    # 공백 정리 (여러 공백을 하나로)
+                    tool_clean = _RE_WS.sub(' ', tool_clean).strip()
+                    if len(tool_clean) > 2:
+                        tools_with_order.append((tool_clean, int(match.group(1)), _P_ALT))
+            # 패턴 6: "💡 추천 도구" 또는 "💡 맞춤 추천" 섹션의 도구명
+            # 💡 섹션에서 도구명 추출 (더 정확한 패턴)
+            if "💡" in content and "추천" in content:
+                # 섹션 내에서 도구명 찾기 (더 구체적인 패턴)
+                recommendation_section = _RE_REC_SECTION.search(content)
+                if recommendation_section:
+                    section_content = recommendation_section.group(0)
+                    # "가장 추천하는 도구: [도구명]" 패턴 다시 확인
+                    for match in _RE_BEST_RECOMMEND.finditer(section_content):
+                        tool_clean = match.group(1).strip().rstrip(_TRAIL)
+                        if len(tool_clean) > 2:
+                            tools_with_order.append((tool_clean, 0, _P_REC_SECTION))
+                    # GitHub Copilot, Cursor 같은 도구명 패턴 찾기 (섹션 내에서만)
+                    for match in _RE_TOOL_NAMES.finditer(section_content.lower()):
+                        canonical = _KNOWN_TOOL_NAMES[_RE_WS.sub(' ', match.group(1))]
+                        tools_with_order.append((canonical, 999, _P_REC_SECTION))
+                
+            # 메시지 단위로만 중단 (같은 답변 안의 순위/대안 정보는 끝까지 수집)
+            scanned_ai_messages += 1
+            candidate_names.update(t.translate(_STRIP_TABLE) for t, _, _ in tools_with_order[message_start:])
+            if scanned_ai_messages >= _MAX_PREVIOUS_AI_MESSAGES or len(candidate_names) >= _MAX_PREVIOUS_TOOLS:
+                break
         
-        # 나머지 도구들 추가 (나타난 순서대로)
-        for tool, order, pattern in tools_with_order:
-            if pattern not in ["rank", "alternative"]:  # 이미 추가된 rank와 alternative는 제외
-                tool_clean = re.sub(r'[\(\)\[\]월\s\$0-9]+', '', tool).strip()
-                if tool_clean and tool_clean not in seen and len(tool_clean) > 2:
-                    seen.add(tool_clean)
-                    unique_tools.append(tool_clean)
+        # 도구명 정제 및 순서 유지 (한 번의 순회로 도구별 최우선 위치만 기록)
+        # 정렬 키: (패턴 우선순위, 명시된 순서, 등장 순서)
+        # - rank > alternative > 나머지 순, rank/alternative는 명시된 순서대로
+        # - 나머지 패턴은 나타난 순서대로
+        best_keys = {}
+        for idx, (tool, order, pattern) in enumerate(tools_with_order):
+            tool_clean = tool.translate(_STRIP_TABLE)
+            if len(tool_clean) <= 2:
+                continue
+            key = (pattern, order, idx) if pattern < _REST_PRIORITY else (_REST_PRIORITY, 0, idx)
+            prev_key = best_keys.get(tool_clean)
+            if prev_key is None or key < prev_key:
+                best_keys[tool_clean] = key
+        unique_tools = sorted(best_keys, key=best_keys.__getitem__)
         
-        previous_tools_ordered = unique_tools[:10]  # 최대 10개
+        previous_tools_ordered = unique_tools[:_MAX_PREVIOUS_TOOLS]  # 최대 10개
         previous_tools = ", ".join(previous_tools_ordered)
-        print(f"🔍 [DEBUG] write_research_brief - 이전 추천 도구 추출: {previous_tools} (순서 유지)")
+        logger.debug("🔍 write_research_brief - 이전 추천 도구 추출: %s (순서 유지)", previous_tools)
     
-    prompt_content = transform_messages_into_research_topic_prompt.format(
-        messages=get_buffer_string(messages_list),
-        date=get_today_str(),
-        current_year=get_current_year(),
-        current_month_year=get_current_month_year(),
-        domain=domain,
-        domain_guide=formatted_domain_guide_for_research,
-        is_followup="YES" if is_followup else "NO",
-        previous_tools=previous_tools if previous_tools else "없음",
-        question_type="comparison"  # 임시값, LLM이 판단한 값으로 대체됨
+    # GIL을 잡는 순수 문자열 작업이므로 스레드로 넘기지 않고 바로 호출 (스레드 전환 비용만 늘어남)
+    prompt_content = _build_research_topic_prompt(
+        messages_list,
+        today,
+        current_year,
+        current_month_year,
+        domain,
+        formatted_domain_guide,
+        is_followup,
+        previous_tools,
     )
     
     response = await research_model.ainvoke([HumanMessage(content=prompt_content)])
     
     # 질문 유형은 LLM이 스스로 판단 (response.question_type 사용)
-    question_type = response.question_type if hasattr(response, 'question_type') else "comparison"
+    question_type = getattr(response, 'question_type', "comparison")
     
-    print(f"🔍 [DEBUG] write_research_brief - Messages: {len(messages_list)}개, 질문 순서: {question_number}번째, Follow-up: {is_followup}, 질문유형: {question_type} (LLM 판단), 이전 도구: {previous_tools}")
+    logger.debug(
+        "🔍 write_research_brief - Messages: %d개, 질문 순서: %d번째, Follow-up: %s, 질문유형: %s (LLM 판단), 이전 도구: %s",
+        len(messages_list), question_number, is_followup, question_type, previous_tools,
+    )
     
     # 디버깅: Research Brief와 제약 조건 확인
-    print(f"🔍 [DEBUG] Research Brief: {response.research_brief[:200]}...")
-    print(f"🔍 [DEBUG] Hard Constraints 추출: {response.hard_constraints}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("🔍 Research Brief: %s...", response.research_brief[:200])
+        logger.debug("🔍 Hard Constraints 추출: %s", getattr(response, "hard_constraints", None))
     
     # 제약 조건을 dict로 변환하여 state에 저장
-    constraints = response.hard_constraints.model_dump() if hasattr(response, 'hard_constraints') and response.hard_constraints else {}
-    
-    # domain_guide도 포맷팅 필요 (current_year 등 포함)
-    try:
-        formatted_domain_guide = domain_guide.format(
-            date=get_today_str(),
-            current_year=get_current_year(),
-            current_month_year=get_current_month_year()
-        )
-    except KeyError:
-        # 포맷팅 변수가 없으면 그대로 사용
-        formatted_domain_guide = domain_guide
+    hard_constraints = getattr(response, 'hard_constraints', None)
+    constraints = hard_constraints.model_dump() if hard_constraints else {}
     
     supervisor_system_prompt = lead_researcher_prompt.format(
-        date=get_today_str(),
-        current_year=get_current_year(),
-        current_month_year=get_current_month_year(),
+        date=today,
+        current_year=current_year,
+        current_month_year=current_month_year,
         domain=domain,
         domain_guide=formatted_domain_guide,
         max_concurrent_research_units=configurable.max_concurrent_research_units,
@@ -218,7 +281,7 @@ async def write_research_brief(
     # 이전 추천 도구 순서를 state에 저장 (Follow-up 질문 처리용)
     update_dict = {
         "research_brief": response.research_brief,
-        "question_type": response.question_type,  # LLM이 판단한 질문 유형 저장
+        "question_type": question_type,  # LLM이 판단한 질문 유형 저장
         "constraints": constraints,  # 제약 조건 저장
         "supervisor_messages": {
             "type": "override",
@@ -232,7 +295,7 @@ async def write_research_brief(
     # Follow-up인 경우 이전 추천 도구 순서 저장
     if is_followup and previous_tools_ordered:
         update_dict["previous_tools_ordered"] = previous_tools_ordered
-        print(f"🔍 [DEBUG] 이전 추천 도구 순서 저장: {previous_tools_ordered}")
+        logger.debug("🔍 이전 추천 도구 순서 저장: %s", previous_tools_ordered)
     
     return Command(
         goto="research_supervisor",
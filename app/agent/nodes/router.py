@@ -1,7 +1,11 @@
 """라우팅 관련 노드 - clarify_with_user, route_after_research"""
 
+import asyncio
+import json
+import logging
 import re
-from typing import Literal
+from collections import OrderedDict
+from typing import Literal, Optional
 
 from app.agent.nodes._common import (
     Command,
@@ -18,10 +22,243 @@ from app.agent.nodes._common import (
     get_today_str,
     get_api_key_for_model,
     query_normalizer,
-    research_cache,
-    vector_store,
+    cached_research_get,
+    cached_similar_query,
+    similar_by_cache_key,
+    cancel_tasks,
 )
-from app.agent.nodes.writer import generate_greeting_dynamically
+from app.agent.nodes.writer import (
+    extract_recommended_tools,
+    generate_greeting_dynamically,
+)
+
+logger = logging.getLogger(__name__)
+
+# 도구명 정제: 괄호/월/$/숫자/공백 문자를 한 번에 삭제하는 translate 테이블
+# (정규식 \s 와 동일하게 유니코드 공백 전체 포함 - 최대값은 U+3000)
+_TOOL_DELETE_CHARS = "()[]월$0123456789" + "".join(
+    ch for ch in map(chr, range(0x3001)) if ch.isspace()
+)
+_TOOL_TRANS = str.maketrans("", "", _TOOL_DELETE_CHARS)
+_GREETING_OPEN = "[GREETING]"
+_GREETING_CLOSE = "[/GREETING]"
+
+# 캐시 HIT 시 인사 멘트 LRU: (질문, 도메인) → 멘트 (첫 질문만)
+# 같은 첫 질문이 반복되면 인사 멘트 생성 LLM 호출을 건너뜀
+# Follow-up 멘트는 이전 대화 맥락에 의존하므로 마지막 질문만으로 캐시하지 않음
+_GREETING_LRU: "OrderedDict[tuple, str]" = OrderedDict()
+_GREETING_LRU_MAXSIZE = 1024
+
+# 답변 형식 요청 감지 패턴 (키워드가 모두 한글이라 lower() 불필요)
+# "표 형식으로"는 "표 형식"에 포함되므로 생략
+_RE_FMT_TABLE = re.compile(r'표로 정리|표로|테이블로|비교표|표 형식')
+_RE_FMT_LIST = re.compile(r'리스트로|목록으로|리스트 형식|목록 형식')
+
+# route_after_research Decision 질문 판정용 키워드
+_DECISION_QUESTION_TYPES = frozenset(("decision", "comparison"))
+_DECISION_KEYWORDS = (
+    "중 하나만", "하나만", "선택", "어떤 것이", "맞을까", "추천", "어떤 도구",
+    "좋을까", "적합", "최적화", "어떤게", "뭘", "무엇을", "어떤게 좋", "어떤 것이 좋",
+    "비교", "vs", "대비", "차이", "어떤게 나은", "더 좋은", "어느게", "최적"
+)
+_RE_DECISION_KEYWORDS = re.compile("|".join(map(re.escape, _DECISION_KEYWORDS)))
+
+# route_after_research 정보 충분 여부 판단용 패턴
+_RE_TEAM_SIZE = re.compile(r'(\d+)\s*명')
+# 개발 언어/프레임워크는 영문 단어 단위로 비교 (히스토리를 한 번 토큰화한 뒤 집합 교집합)
+# 부분 문자열 비교는 "r"/"go"처럼 짧은 이름이 아무 영어 단어에나 걸리는 문제가 있음
+_DEV_LANGUAGES = frozenset(("python", "javascript", "java", "typescript", "c++", "c#", "go", "rust", "php", "ruby", "swift", "kotlin", "dart", "r", "scala", "clojure", "perl", "lua", "matlab"))
+_DEV_FRAMEWORKS = frozenset(("react", "vue", "angular", "django", "flask", "spring", "node.js", "express", "fastapi", "laravel", "rails"))
+_DEV_NAMES = _DEV_LANGUAGES | _DEV_FRAMEWORKS
+_RE_ASCII_TOKEN = re.compile(r'[a-z0-9+#.]+')
+# 개발 분야 키워드 + "~으로 개발" 표현은 하나의 정규식으로 한 번만 스캔
+_DEV_DOMAINS = ("웹 개발", "백엔드", "프론트엔드", "풀스택", "모바일", "게임", "데이터", "ai", "ml", "머신러닝", "앱 개발")
+_RE_DEV_AREA = re.compile(
+    "|".join(map(re.escape, _DEV_DOMAINS))
+    + r'|으로\s*개발|로\s*개발|개발'
+)
+_RE_VAGUE_PATTERNS = (
+    re.compile(r'나\s*개발\s*할건데'),  # "나 개발 할건데"
+    re.compile(r'개발\s*할건데'),  # "개발 할건데"
+    re.compile(r'개발\s*하려고\s*하는데'),  # "개발 하려고 하는데"
+    re.compile(r'개발\s*하려는데'),  # "개발 하려는데"
+)
+
+# clarify_with_user 주제 이탈 사전 차단: URL을 지운 뒤 글자(한글/영문 등)가 하나도 없으면 거부
+# (이모지만, 기호만, URL만 있는 입력 - 도구명만 있는 짧은 질문이나 인사는 LLM 판단에 맡김)
+_RE_URL = re.compile(r'(?:https?://|www\.)\S+', re.IGNORECASE)
+_OFF_TOPIC_DEFAULT = "죄송합니다. 저는 코딩 AI 도구 추천을 전문으로 하는 어시스턴트입니다. 다시 말씀해주세요!"
+
+# 메시지 필터용 클래스 (isinstance 대신 identity 비교)
+_HumanCls = HumanMessage
+_AICls = AIMessage
+
+
+def _any_contains(texts: list, keyword: str) -> bool:
+    """여러 메시지 중 하나라도 키워드를 포함하는지 (발견 즉시 중단)"""
+    return any(keyword in text for text in texts)
+
+
+def _first_search(pattern: "re.Pattern", texts: list):
+    """메시지 순서대로 패턴을 검색해 첫 매치 반환 (없으면 None)"""
+    for text in texts:
+        match = pattern.search(text)
+        if match:
+            return match
+    return None
+
+
+def _extract_report_body(cached_content: str) -> Optional[str]:
+    """캐시된 답변에서 리포트 본문 추출 ([GREETING] 태그 제거, 200자 미만이면 None)"""
+    report_body = cached_content.strip()
+    
+    # 🚨 [GREETING] 태그가 있으면 제거하고 리포트 본문만 추출
+    # 인사 멘트는 캐시에서 가져오지 않고 항상 새로 생성
+    # (태그 위치를 find로 찾아 슬라이싱 - 정규식 없이 한 번의 스캔)
+    start = cached_content.find(_GREETING_OPEN)
+    if start >= 0:
+        end = cached_content.find(_GREETING_CLOSE, start + len(_GREETING_OPEN))
+        if end >= 0:
+            # 인사말 태그 제거하고 리포트 본문만 추출
+            report_body = (cached_content[:start] + cached_content[end + len(_GREETING_CLOSE):]).strip()
+            logger.debug("✅ [캐시] [GREETING] 태그 제거 후 리포트 본문 추출: %s자", len(report_body))
+    
+    # 리포트 본문이 비어있거나 너무 짧으면 원본 사용
+    if not report_body or len(report_body) < 50:
+        logger.debug("⚠️ [캐시 처리] 리포트 본문이 비어있음 - 원본 캐시 내용 사용")
+        report_body = cached_content.strip()
+    
+    # 🚨 캐시 검증: 리포트가 너무 짧으면(200자 미만) 캐시 무시
+    if len(report_body) < 200:
+        logger.debug("⚠️ [캐시 무시] 리포트 본문이 너무 짧음 (%s자). 캐시 무시하고 새로 생성", len(report_body))
+        return None
+    return report_body
+
+
+def _is_table_json(report_body: str) -> bool:
+    """캐시 본문이 JSON 표 형식 데이터인지 확인 (표 형식은 캐시를 쓰지 않고 새로 생성)"""
+    if not (report_body.startswith('{') or report_body.startswith('[')):
+        return False
+    try:
+        json_data = json.loads(report_body)
+    except (json.JSONDecodeError, ValueError, TypeError):
+        # JSON 형식이 아니면 정상 처리
+        return False
+    return isinstance(json_data, dict) and json_data.get("type") == "table"
+
+
+async def _finalize_cached(
+    cached_content: str,
+    messages: list,
+    config: RunnableConfig,
+    is_followup: bool,
+    last_user_message: str,
+    domain: str,
+    messages_context: str,
+    dynamic_greeting: str = "",
+) -> Optional[Command]:
+    """캐시된 답변으로 최종 응답 구성 (본문 추출 → 표 형식 필터 → 인사 멘트 생성), 사용할 수 없으면 None"""
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("🔍 [캐시 처리] 캐시된 답변 길이: %s자, is_followup: %s", len(cached_content), is_followup)
+        logger.debug("🔍 [캐시 처리] 캐시된 답변 시작 100자: %.100s", cached_content)
+    
+    # 리포트 본문 추출 (캐시에는 리포트 본문만 저장되어 있음)
+    report_body = _extract_report_body(cached_content)
+    if report_body is None:
+        return None
+    
+    # 🚨 캐시에 JSON 형식(표 형식)이 저장되어 있으면 무시하고 새로 생성
+    if _is_table_json(report_body):
+        logger.debug("⚠️ [캐시 무시] 캐시에 JSON 형식(표 형식)이 저장되어 있음 - 캐시 무시하고 새로 생성")
+        return None
+    
+    # 🚨 인사 멘트는 캐시하지 않음: 주제 검증 LLM이 함께 생성한 멘트를 우선 사용 (추가 LLM 왕복 없음)
+    # 없거나 너무 짧을 때만 별도 LLM 호출로 동적 생성 (공통 함수 사용)
+    greeting = dynamic_greeting.strip() if dynamic_greeting else ""
+    if len(greeting) >= 20:
+        logger.debug("✅ [캐시 처리] 리포트 본문은 캐시에서 가져옴 (%s자), 인사 멘트는 주제 검증 응답 사용", len(report_body))
+    else:
+        logger.debug("✅ [캐시 처리] 리포트 본문은 캐시에서 가져옴 (%s자), 인사 멘트는 LLM으로 동적 생성", len(report_body))
+        greeting = await _generate_greeting(messages, config, is_followup, last_user_message, domain, messages_context)
+    
+    return Command(
+        goto=END,
+        update={
+            "messages": [
+                AIMessage(content=greeting),
+                AIMessage(content=report_body)
+            ]
+        }
+    )
+
+
+async def _search_similar_query(
+    similar_task: "asyncio.Task",
+    last_user_message: str,
+    normalized_text: str,
+    domain: str,
+) -> Optional[dict]:
+    """벡터 DB 유사 질문 검색 (원본 → 정규화 → 낮은 임계값 순으로 재시도)"""
+    # 1차: 원본 질문으로 검색 (동일 질문 또는 매우 유사한 질문 발견 가능) - Redis 조회와 동시에 시작한 결과 사용
+    similar_query = await similar_task
+    
+    # 2차: 원본 질문으로 못 찾으면 정규화된 텍스트로 검색
+    # (이하 Redis/벡터 DB 조회는 모두 동기 클라이언트이므로 이벤트 루프를 막지 않도록 스레드에서 실행)
+    if not similar_query or not similar_query.get("cache_key"):
+        similar_query = await asyncio.to_thread(
+            cached_similar_query,
+            normalized_text,
+            domain=domain,
+            score_threshold=0.70  # 정규화된 텍스트도 동일한 임계값 사용
+        )
+    
+    # 3차: 여전히 못 찾으면 더 낮은 임계값으로 재시도
+    if not similar_query or not similar_query.get("cache_key"):
+        # 원본 질문과 정규화된 텍스트 모두 더 낮은 임계값으로 재시도
+        for query_variant in [last_user_message, normalized_text]:
+            similar_query = await asyncio.to_thread(
+                cached_similar_query,
+                query_variant,
+                domain=domain,
+                score_threshold=0.65  # 더 낮은 임계값으로 재시도
+            )
+            if similar_query and similar_query.get("cache_key"):
+                break
+    
+    return similar_query
+
+
+async def _generate_greeting(
+    messages: list,
+    config: RunnableConfig,
+    is_followup: bool,
+    last_user_message: str,
+    domain: str,
+    messages_context: str,
+) -> str:
+    """캐시된 리포트 앞에 붙일 인사 멘트 생성 (첫 질문은 프로세스 내 LRU → LLM → 질문 기반 fallback 순)"""
+    lru_key = None if is_followup else (last_user_message, domain)
+    greeting = _GREETING_LRU.get(lru_key) if lru_key else None
+    if greeting:
+        _GREETING_LRU.move_to_end(lru_key)
+        logger.debug("✅ [인사 멘트] 메모리 캐시 사용: '%s'", greeting)
+        return greeting
+    
+    greeting = await generate_greeting_dynamically(messages, config, is_followup, messages_context=messages_context)
+    if not greeting or len(greeting) < 20:
+        # LLM 생성 실패 시 질문 기반 최소 생성 (fallback은 캐시하지 않음)
+        if last_user_message:
+            greeting = f"{last_user_message[:50]}에 대해 분석해드리겠습니다."
+        else:
+            greeting = "분석해드리겠습니다."
+        logger.warning("⚠️ [인사 멘트] LLM 멘트 생성 실패 또는 너무 짧음, fallback 사용: '%s'", greeting)
+        return greeting
+    
+    if lru_key:
+        _GREETING_LRU[lru_key] = greeting
+        if len(_GREETING_LRU) > _GREETING_LRU_MAXSIZE:
+            _GREETING_LRU.popitem(last=False)
+    return greeting
 
 
 async def clarify_with_user(
@@ -34,15 +271,29 @@ async def clarify_with_user(
     domain = state.get("domain", "AI 서비스")
     
     # 질문 순서 파악: HumanMessage 개수로 판단 (더 정확하게)
-    human_messages = [msg for msg in messages if isinstance(msg, HumanMessage)]
-    question_number = len(human_messages)  # 1번째, 2번째, 3번째 질문...
+    # 대화 이력을 구성한 호출자(chat.py)가 세어 둔 값을 우선 사용, 없으면 제너레이터로 셈
+    question_number = state.get("human_message_count")
+    if question_number is None:
+        question_number = sum(1 for msg in messages if msg.__class__ is _HumanCls)  # 1번째, 2번째, 3번째 질문...
     is_followup = question_number > 1  # 2번째 질문부터 Follow-up
     
     # 디버깅
-    print(f"🔍 [DEBUG] clarify - Messages: {len(messages)}개, HumanMessage: {len(human_messages)}개, 질문 순서: {question_number}번째, Follow-up: {is_followup}")
+    logger.debug("🔍 [DEBUG] clarify - Messages: %s개, HumanMessage: %s개, 질문 순서: %s번째, Follow-up: %s", len(messages), question_number, question_number, is_followup)
     
     last_user_message = messages[-1].content if messages else ""
     
+    # ========== ⚡ 주제 이탈 사전 차단 (LLM 호출 없이) ==========
+    # 첫 질문에 글자가 하나도 없으면 (이모지만, 기호만, URL만 등) LLM 왕복 없이 거부
+    # Follow-up은 이전 대화 맥락상 유효할 수 있으므로 적용하지 않음
+    if configurable.enable_offtopic_precheck and not is_followup:
+        text_without_urls = _RE_URL.sub("", str(last_user_message))
+        if not any(ch.isalpha() for ch in text_without_urls):
+            logger.debug("⚠️ [주제 검증] 글자 없는 질문 (이모지/URL만) - LLM 호출 없이 차단: '%s'", last_user_message)
+            return Command(
+                goto=END,
+                update={"messages": [AIMessage(content=_OFF_TOPIC_DEFAULT)]}
+            )
+    
     # ========== 🚨 LLM 기반 주제 검증 및 인사 감지 (검색/캐시 전에 먼저 수행) ==========
     # 주제 검증을 LLM이 판단하도록 하여 불필요한 쿼리 정규화/캐시 조회 방지
     # 키워드 선검증 제거: LLM이 모든 질문의 주제 관련성을 판단
@@ -59,27 +310,66 @@ async def clarify_with_user(
         .with_config(model_config_clarify)
     )
     
+    # 대화 이력 직렬화는 한 번만 수행 (주제 검증 프롬프트와 인사 멘트 생성에서 재사용)
+    # 긴 대화는 최근 메시지 창만 직렬화 (프롬프트 토큰과 문자열 생성 비용이 대화 길이에 비례해 커지지 않도록)
+    window = configurable.clarify_message_window
+    recent_messages = messages[-window:] if window > 0 else messages
+    buffer_string = get_buffer_string(recent_messages) if recent_messages else ""
+    
     prompt_content = clarify_with_user_instructions.format(
-        messages=get_buffer_string(messages),
+        messages=buffer_string,
         date=get_today_str(),
         domain=domain,
         is_followup="YES" if is_followup else "NO"
     )
     
-    response = await clarification_model.ainvoke([HumanMessage(content=prompt_content)])
+    # 쿼리 정규화 모델 설정 (정규화는 짧게)
+    model_config = {
+        "model": configurable.research_model,
+        "max_tokens": 200,
+        "api_key": get_api_key_for_model(configurable.research_model, config),
+    }
+    
+    # 주제 검증 LLM 호출은 가장 느리므로 먼저 시작해 두고, 그동안 정규화 → 캐시 조회 / 유사 질문 검색을 진행
+    # (주제 검증 결과는 인사/주제 이탈 판단이 필요한 시점에만 기다림, 조기 반환하면 조회 결과는 버림)
+    # Redis/벡터 DB는 동기 클라이언트이므로 스레드에서 실행
+    clarification_task = asyncio.create_task(
+        clarification_model.ainvoke([HumanMessage(content=prompt_content)])
+    )
+    # 1차 유사 질문 검색은 원본 질문 기준이라 정규화 결과가 필요 없음 → 바로 시작
+    similar_task = asyncio.create_task(
+        asyncio.to_thread(
+            cached_similar_query,
+            last_user_message,
+            domain=domain,
+            score_threshold=0.70  # 유사 질문 감지율 향상 (0.75 → 0.70)
+        )
+    )
+    cache_task = None
+    try:
+        normalized = await query_normalizer.normalize(last_user_message, config=model_config)
+        cache_key = normalized["cache_key"]
+        cache_task = asyncio.create_task(
+            asyncio.to_thread(cached_research_get, cache_key, domain=domain, prefix="final")
+        )
+        response = await clarification_task
+    except BaseException:
+        cancel_tasks(clarification_task, similar_task, cache_task)
+        raise
     
     # 🆕 인사 메시지 체크 (가장 먼저!)
     if response.is_greeting:
-        print(f"👋 [인사 응답] LLM이 인사 메시지 감지 - 친절하게 응답")
+        logger.debug("👋 [인사 응답] LLM이 인사 메시지 감지 - 친절하게 응답")
         # LLM이 greeting_message를 생성하도록 프롬프트에서 명시했으므로, 없으면 경고하고 fallback 사용
         greeting_msg = response.greeting_message
         if not greeting_msg or greeting_msg.strip() == "":
-            print(f"⚠️ [인사 응답] LLM이 greeting_message를 생성하지 않음 - fallback 사용")
+            logger.warning("⚠️ [인사 응답] LLM이 greeting_message를 생성하지 않음 - fallback 사용")
             greeting_msg = (
                 "안녕하세요! 반갑습니다 😊\n\n"
                 "저는 코딩 AI 도구 추천을 전문으로 하는 어시스턴트입니다. "
                 "팀에 적합한 코딩 AI 도구(코드 작성, 리뷰, 자동 완성 등)에 대해 궁금한 점이 있으면 언제든지 물어보세요!"
             )
+        cancel_tasks(similar_task, cache_task)
         return Command(
             goto=END,
             update={"messages": [AIMessage(content=greeting_msg)]}
@@ -87,68 +377,52 @@ async def clarify_with_user(
     
     # 🚨 주제 관련성 체크 (검색/캐시 전 차단)
     if not response.is_on_topic:
-        print(f"⚠️ [주제 검증] 주제에서 벗어난 질문 감지 - 캐시/검색/벡터DB 저장 차단")
-        off_topic_msg = response.off_topic_message if response.off_topic_message else "죄송합니다. 저는 코딩 AI 도구 추천을 전문으로 하는 어시스턴트입니다. 다시 말씀해주세요!"
+        logger.debug("⚠️ [주제 검증] 주제에서 벗어난 질문 감지 - 캐시/검색/벡터DB 저장 차단")
+        off_topic_msg = response.off_topic_message if response.off_topic_message else _OFF_TOPIC_DEFAULT
+        cancel_tasks(similar_task, cache_task)
         return Command(
             goto=END,
             update={"messages": [AIMessage(content=off_topic_msg)]}
         )
     
-    # 주제 검증 통과 → 이제 쿼리 정규화 및 캐시 조회 진행
-    print(f"✅ [주제 검증] 주제 검증 통과 - 정상 프로세스 진행")
+    # 주제 검증 통과 → 이미 진행 중인 캐시 조회 / 유사 질문 검색 결과 사용
+    logger.debug("✅ [주제 검증] 주제 검증 통과 - 정상 프로세스 진행")
     
-    # ========== 🆕 1단계: 쿼리 정규화 (캐시 키 생성) ==========
+    # ========== 🆕 1단계: 쿼리 정규화 (캐시 키 생성) - 주제 검증 LLM 호출 대기 중에 위에서 완료 ==========
     # 🚨 중요: 캐시 조회를 먼저 하고, 캐시에서 못 찾으면 response_format 감지
     # 캐시에서 가져올 때는 response_format을 무시하고 저장된 내용 그대로 반환
-    model_config = {
-        "model": configurable.research_model,
-        "max_tokens": 200,  # 정규화는 짧게
-        "api_key": get_api_key_for_model(configurable.research_model, config),
-    }
     
-    normalized = await query_normalizer.normalize(last_user_message, config=model_config)
-    cache_key = normalized["cache_key"]
+    # ========== 🆕 2단계: Redis 최종 답변 캐시 조회 (위에서 시작한 조회 결과 사용) ==========
+    logger.debug("🔍 [캐시 조회] 원본 질문: '%.50s...'", last_user_message)
+    logger.debug("🔍 [캐시 조회] 정규화: '%s' → 캐시키: %.16s...", normalized['normalized_text'], cache_key)
     
-    # ========== 🆕 2단계: Redis 최종 답변 캐시 조회 ==========
-    print(f"🔍 [캐시 조회] 원본 질문: '{last_user_message[:50]}...'")
-    print(f"🔍 [캐시 조회] 정규화: '{normalized['normalized_text']}' → 캐시키: {cache_key[:16]}...")
-    
-    cached_answer = research_cache.get(cache_key, domain=domain, prefix="final")
+    cached_answer = await cache_task
     if cached_answer:
-        print(f"✅ [캐시 HIT] 최종 답변 반환 (캐시키: {cache_key[:16]}...)")
+        logger.debug("✅ [캐시 HIT] 최종 답변 반환 (캐시키: %.16s...)", cache_key)
         
         # Follow-up인 경우 이전 추천 도구 확인
         # 단, 같은 의미의 질문(같은 캐시 키)이면 이전 추천 도구 확인 건너뛰고 캐시 사용
         if is_followup:
-            # 이전 메시지에서 추천된 도구 추출 (모든 AI 메시지에서)
+            # 이전 메시지에서 추천된 도구 추출
+            # 캐시 검증 기준은 "직전 추천 세트"이므로, 도구가 발견된 가장 최근 AI 메시지 하나만 사용
+            # 호출자(chat.py)가 대화 이력을 구성하면서 추출한 state["previous_tools"]를 우선 사용 (대화 이력 재스캔 없음)
             previous_tools_in_messages = []
-            all_tools = []
-            for msg in reversed(messages[:-1]):  # 마지막 사용자 메시지 제외
-                if isinstance(msg, AIMessage) and hasattr(msg, 'content'):
-                    content = str(msg.content)
-                    # 다양한 패턴으로 도구명 추출
-                    # 패턴 1: 📊 [도구명]
-                    tools_found = re.findall(r'📊\s+([^\n]+)', content)
-                    if tools_found:
-                        all_tools.extend([t.strip() for t in tools_found])
-                    # 패턴 2: ## 📊 [도구명]
-                    tools_found2 = re.findall(r'##\s+📊\s+([^\n]+)', content)
-                    if tools_found2:
-                        all_tools.extend([t.strip() for t in tools_found2])
-                    # 패턴 3: **1순위: [도구명]**, **2순위: [도구명]**
-                    tools_found3 = re.findall(r'\*\*[0-9]+순위:\s*([^\*]+)\*\*', content)
-                    if tools_found3:
-                        all_tools.extend([t.strip() for t in tools_found3])
-                    # 패턴 4: **최종 추천: [도구명]**
-                    tools_found4 = re.findall(r'\*\*최종 추천:\s*([^\*]+)\*\*', content)
-                    if tools_found4:
-                        all_tools.extend([t.strip() for t in tools_found4])
+            all_tools = state.get("previous_tools")
+            if all_tools is None:
+                # 호출자가 previous_tools를 넘기지 않은 경우 → 메시지 이력에서 직접 추출
+                all_tools = []
+                for msg in reversed(messages[:-1]):  # 마지막 사용자 메시지 제외
+                    if msg.__class__ is _AICls:
+                        # 다양한 패턴으로 도구명 추출 (📊, ## 📊, N순위, 최종 추천)
+                        all_tools = extract_recommended_tools(str(msg.content))
+                        if all_tools:
+                            break
             
             # 중복 제거
             seen = set()
             for tool in all_tools:
                 # 도구명 정제 (불필요한 문자 제거)
-                tool_clean = re.sub(r'[\(\)\[\]월\s\$0-9]+', '', tool).strip()
+                tool_clean = tool.translate(_TOOL_TRANS).strip()
                 if tool_clean and tool_clean not in seen and len(tool_clean) > 2:
                     seen.add(tool_clean)
                     previous_tools_in_messages.append(tool_clean)
@@ -156,223 +430,94 @@ async def clarify_with_user(
             # 이전 추천 도구가 있으면 캐시 검증, 없으면 같은 의미의 질문이므로 캐시 그대로 사용
             if previous_tools_in_messages:
                 # 캐시된 답변에서 도구 추출 (다양한 패턴)
-                cached_tools = []
-                cached_content = cached_answer["content"]
-                # 패턴 1: 📊 [도구명]
-                tools_found = re.findall(r'📊\s+([^\n]+)', cached_content)
-                cached_tools.extend([t.strip() for t in tools_found])
-                # 패턴 2: ## 📊 [도구명]
-                tools_found2 = re.findall(r'##\s+📊\s+([^\n]+)', cached_content)
-                cached_tools.extend([t.strip() for t in tools_found2])
-                # 패턴 3: **1순위: [도구명]**
-                tools_found3 = re.findall(r'\*\*[0-9]+순위:\s*([^\*]+)\*\*', cached_content)
-                cached_tools.extend([t.strip() for t in tools_found3])
+                cached_tools = extract_recommended_tools(cached_answer["content"])
                 
                 # 이전 추천 도구와 캐시된 답변의 도구가 다르면 캐시 무시
                 if cached_tools:
                     # 도구명 정제
-                    previous_tools_clean = [re.sub(r'[\(\)\[\]월\s\$0-9]+', '', t).strip() for t in previous_tools_in_messages]
-                    cached_tools_clean = [re.sub(r'[\(\)\[\]월\s\$0-9]+', '', t).strip() for t in cached_tools]
+                    previous_tools_clean = [t.translate(_TOOL_TRANS).strip() for t in previous_tools_in_messages]
+                    cached_tools_clean = [t.translate(_TOOL_TRANS).strip() for t in cached_tools]
                     
                     previous_tools_set = set([t for t in previous_tools_clean if len(t) > 2])
                     cached_tools_set = set([t for t in cached_tools_clean if len(t) > 2])
                     
-                    # 이전 추천 도구가 캐시에 없거나, 캐시에 이전에 추천하지 않은 새 도구가 있으면 무시
-                    if not previous_tools_set.issubset(cached_tools_set) or len(cached_tools_set - previous_tools_set) > 0:
-                        print(f"⚠️ [캐시 무시] 이전 추천 도구({previous_tools_in_messages})와 캐시 도구({cached_tools})가 다름. 캐시 무시하고 새로 생성")
+                    # 이전 추천 도구가 캐시에 없거나, 캐시에 이전에 추천하지 않은 새 도구가 있으면 무시 (= 두 집합이 다름)
+                    if previous_tools_set != cached_tools_set:
+                        logger.debug("⚠️ [캐시 무시] 이전 추천 도구(%s)와 캐시 도구(%s)가 다름. 캐시 무시하고 새로 생성", previous_tools_in_messages, cached_tools)
                         cached_answer = None  # 캐시 무시
             else:
                 # 이전 추천 도구가 없으면 같은 의미의 질문이므로 캐시 그대로 사용
-                print(f"✅ [캐시 사용] 이전 추천 도구 없음 - 같은 의미의 질문으로 판단, 캐시 사용")
+                logger.debug("✅ [캐시 사용] 이전 추천 도구 없음 - 같은 의미의 질문으로 판단, 캐시 사용")
         
         if cached_answer:
-            # 캐시된 답변 처리
-            cached_content = cached_answer.get("content", "")
-            
-            # 🚨 JSON 형식(표 형식) 체크 및 필터링
-            # 캐시에 JSON 형식이 저장되어 있으면 무시하고 새로 생성
-            import json
-            is_json_format = False
-            try:
-                # JSON 형식인지 확인 (표 형식 데이터)
-                if cached_content.strip().startswith('{') or cached_content.strip().startswith('['):
-                    json_data = json.loads(cached_content)
-                    if isinstance(json_data, dict) and "type" in json_data and json_data.get("type") == "table":
-                        is_json_format = True
-                        print(f"⚠️ [캐시 무시] 캐시에 JSON 형식(표 형식)이 저장되어 있음 - 캐시 무시하고 새로 생성")
-                        cached_answer = None  # JSON 형식이면 캐시 무시
-            except (json.JSONDecodeError, ValueError, TypeError):
-                # JSON 형식이 아니면 정상 처리
-                pass
-            
-            if cached_answer and not is_json_format:
-                print(f"🔍 [캐시 처리] 캐시된 답변 길이: {len(cached_content)}자, is_followup: {is_followup}")
-                print(f"🔍 [캐시 처리] 캐시된 답변 시작 100자: {cached_content[:100]}")
-                
-                # 리포트 본문 추출 (캐시에는 리포트 본문만 저장되어 있음)
-                report_body = cached_content.strip()
-                
-                # 🚨 [GREETING] 태그가 있으면 제거하고 리포트 본문만 추출
-                # 인사 멘트는 캐시에서 가져오지 않고 항상 새로 생성
-                if "[GREETING]" in cached_content and "[/GREETING]" in cached_content:
-                    match = re.search(r'\[GREETING\](.*?)\[/GREETING\]', cached_content, re.DOTALL)
-                    if match:
-                        # 인사말 태그 제거하고 리포트 본문만 추출
-                        report_body = cached_content.replace(match.group(0), "").strip()
-                        print(f"✅ [캐시] [GREETING] 태그 제거 후 리포트 본문 추출: {len(report_body)}자")
-                
-                # 리포트 본문이 비어있거나 너무 짧으면 원본 사용
-                if not report_body or len(report_body) < 50:
-                    print(f"⚠️ [캐시 처리] 리포트 본문이 비어있음 - 원본 캐시 내용 사용")
-                    report_body = cached_content.strip()
-                
-                # 🚨 캐시 검증: 리포트 본문이 유효한지 확인
-                # 리포트가 너무 짧거나(200자 미만) 비어있으면 캐시 무시
-                if len(report_body) < 200:
-                    print(f"⚠️ [캐시 무시] 리포트 본문이 너무 짧음 ({len(report_body)}자). 캐시 무시하고 새로 생성")
-                    cached_answer = None  # 캐시 무시
-                else:
-                    # 🚨 인사 멘트는 항상 LLM으로 동적 생성 (공통 함수 사용)
-                    print(f"✅ [캐시 처리] 리포트 본문은 캐시에서 가져옴 ({len(report_body)}자), 인사 멘트는 LLM으로 동적 생성")
-                    
-                    greeting = await generate_greeting_dynamically(messages, config, is_followup)
-                    if not greeting or len(greeting) < 20:
-                        # LLM 생성 실패 시 질문 기반 최소 생성
-                        if last_user_message:
-                            greeting = f"{last_user_message[:50]}에 대해 분석해드리겠습니다."
-                        else:
-                            greeting = "분석해드리겠습니다."
-                        print(f"⚠️ [캐시 처리] LLM 멘트 생성 실패 또는 너무 짧음, fallback 사용: '{greeting}'")
-                    print(f"✅ [캐시 처리] 리포트 본문 길이: {len(report_body)}자, 시작 100자: {report_body[:100]}")
-                    
-                    return Command(
-                        goto=END,
-                        update={"messages": [
-                            AIMessage(content=greeting),
-                            AIMessage(content=report_body)
-                        ]}
-                    )
+            # 캐시된 답변 처리 (JSON 표 형식/짧은 본문이면 None → 새로 생성)
+            command = await _finalize_cached(
+                cached_answer.get("content", ""), messages, config, is_followup, last_user_message, domain, buffer_string,
+                response.dynamic_greeting,
+            )
+            if command is not None:
+                similar_task.cancel()  # 캐시 HIT로 반환 → 유사 질문 검색 결과 불필요
+                return command
     
-    print(f"⚠️ [캐시 MISS] 정규화된 쿼리: '{normalized['normalized_text']}' (키워드: {normalized['keywords']})")
+    logger.debug("⚠️ [캐시 MISS] 정규화된 쿼리: '%s' (키워드: %s)", normalized['normalized_text'], normalized['keywords'])
     
     # ========== 🆕 3단계: 벡터 DB로 유사 질문 검색 ==========
     # 캐시 미스 시 유사한 질문이 있는지 벡터 DB에서 검색
     # 🚨 중요: 원본 질문을 먼저 검색하고, 그 다음 정규화된 텍스트로 검색
     # 동일하거나 유사한 질문은 원본 질문으로 먼저 찾을 가능성이 높음
     
-    # 1차: 원본 질문으로 검색 (동일 질문 또는 매우 유사한 질문 발견 가능)
-    similar_query = vector_store.search_similar_query(
-        query=last_user_message,
-        domain=domain,
-        limit=1,
-        score_threshold=0.70  # 유사 질문 감지율 향상 (0.75 → 0.70)
-    )
-    
-    # 2차: 원본 질문으로 못 찾으면 정규화된 텍스트로 검색
-    if not similar_query or not similar_query.get("cache_key"):
-        similar_query = vector_store.search_similar_query(
-            query=normalized['normalized_text'],
-            domain=domain,
-            limit=1,
-            score_threshold=0.70  # 정규화된 텍스트도 동일한 임계값 사용
-        )
-    
-    # 3차: 여전히 못 찾으면 더 낮은 임계값으로 재시도
-    if not similar_query or not similar_query.get("cache_key"):
-        # 원본 질문과 정규화된 텍스트 모두 더 낮은 임계값으로 재시도
-        for query_variant in [last_user_message, normalized['normalized_text']]:
-            similar_query = vector_store.search_similar_query(
-                query=query_variant,
-                domain=domain,
-                limit=1,
-                score_threshold=0.65  # 더 낮은 임계값으로 재시도
-            )
-            if similar_query and similar_query.get("cache_key"):
-                break
+    # 0차: 같은 정규화 캐시키로 최근에 찾은 유사 질문이 있으면 검색 단계 전체 생략
+    similar_key = (cache_key, domain)
+    similar_query = similar_by_cache_key.get(similar_key)
+    if similar_query is not None:
+        similar_task.cancel()
+        logger.debug("✅ [유사 질문] 메모리 캐시 사용 (캐시키: %.16s...)", cache_key)
+    else:
+        similar_query = await _search_similar_query(similar_task, last_user_message, normalized['normalized_text'], domain)
+        if similar_query and similar_query.get("cache_key"):
+            similar_by_cache_key.set(similar_key, similar_query)
     
     if similar_query and similar_query.get("cache_key"):
         similar_cache_key = similar_query["cache_key"]
-        print(f"🔍 [유사 질문 발견] 유사도: {similar_query['score']:.3f}, 기존 질문: '{similar_query['query'][:50]}...'")
-        print(f"🔍 [유사 질문] 캐시 키 재사용: {similar_cache_key[:16]}...")
+        logger.debug("🔍 [유사 질문 발견] 유사도: %.3f, 기존 질문: '%.50s...'", similar_query['score'], similar_query['query'])
+        logger.debug("🔍 [유사 질문] 캐시 키 재사용: %.16s...", similar_cache_key)
         
         # 유사 질문의 캐시 키로 Redis에서 답변 가져오기
-        cached_answer = research_cache.get(similar_cache_key, domain=domain, prefix="final")
+        cached_answer = await asyncio.to_thread(cached_research_get, similar_cache_key, domain=domain, prefix="final")
         if cached_answer:
-            print(f"✅ [유사 질문 캐시 HIT] 최종 답변 반환 (유사 질문의 캐시 키: {similar_cache_key[:16]}...)")
-            
-            # 리포트 본문 추출 및 인사 멘트 생성 (기존 로직과 동일)
-            cached_content = cached_answer["content"]
-            report_body = cached_content.strip()
+            logger.debug("✅ [유사 질문 캐시 HIT] 최종 답변 반환 (유사 질문의 캐시 키: %.16s...)", similar_cache_key)
             
-            # [GREETING] 태그 제거
-            if "[GREETING]" in cached_content and "[/GREETING]" in cached_content:
-                match = re.search(r'\[GREETING\](.*?)\[/GREETING\]', cached_content, re.DOTALL)
-                if match:
-                    report_body = cached_content.replace(match.group(0), "").strip()
-            
-            if not report_body or len(report_body) < 50:
-                report_body = cached_content.strip()
-            
-            # 🚨 JSON 형식(표 형식) 체크 및 필터링
-            import json
-            is_json_format = False
-            try:
-                # JSON 형식인지 확인 (표 형식 데이터)
-                if report_body.strip().startswith('{') or report_body.strip().startswith('['):
-                    json_data = json.loads(report_body)
-                    if isinstance(json_data, dict) and "type" in json_data and json_data.get("type") == "table":
-                        is_json_format = True
-                        print(f"⚠️ [유사 질문 캐시 무시] 캐시에 JSON 형식(표 형식)이 저장되어 있음 - 캐시 무시하고 새로 생성")
-                        cached_answer = None
-            except (json.JSONDecodeError, ValueError, TypeError):
-                # JSON 형식이 아니면 정상 처리
-                pass
-            
-            if cached_answer and not is_json_format and len(report_body) >= 200:
-                # 인사 멘트 생성 (LLM으로 동적 생성)
-                print(f"✅ [유사 질문 처리] 리포트 본문은 캐시에서 가져옴 ({len(report_body)}자), 인사 멘트는 LLM으로 동적 생성")
-                
-                greeting = await generate_greeting_dynamically(messages, config, is_followup)
-                if not greeting or len(greeting) < 20:
-                    # LLM 생성 실패 시 질문 기반 최소 생성
-                    if last_user_message:
-                        greeting = f"{last_user_message[:50]}에 대해 분석해드리겠습니다."
-                    else:
-                        greeting = "분석해드리겠습니다."
-                    print(f"⚠️ [유사 질문 처리] LLM 멘트 생성 실패 또는 너무 짧음, fallback 사용: '{greeting}'")
-                
-                return Command(
-                    goto=END,
-                    update={"messages": [
-                        AIMessage(content=greeting),
-                        AIMessage(content=report_body)
-                    ]}
-                )
+            # 리포트 본문 추출 및 인사 멘트 생성 (Redis 캐시 HIT와 동일한 처리)
+            command = await _finalize_cached(
+                cached_answer["content"], messages, config, is_followup, last_user_message, domain, buffer_string,
+                response.dynamic_greeting,
+            )
+            if command is not None:
+                return command
     
     # 캐시 미스 및 유사 질문도 없음 → 새로 생성
     # 주제 검증은 이미 위(라인 69)에서 완료되었으므로 response를 재사용
-    print(f"⚠️ [캐시 MISS + 유사 질문 없음] 새로 생성 진행 (주제 검증 완료)")
+    logger.debug("⚠️ [캐시 MISS + 유사 질문 없음] 새로 생성 진행 (주제 검증 완료)")
     
     # ========== 🆕 답변 형식 요청 감지 (캐시 미스 시에만) ==========
     # 사용자가 요청한 답변 형식 감지 (표, 테이블, 리스트 등)
     # 🚨 중요: 캐시에서 가져온 경우는 response_format을 무시하므로, 여기서만 감지
     response_format = None
-    last_user_message_lower = last_user_message.lower()
     
-    if any(keyword in last_user_message_lower for keyword in ["표로 정리", "표로", "테이블로", "비교표", "표 형식", "표 형식으로"]):
+    if _RE_FMT_TABLE.search(last_user_message):
         response_format = "table"
-        print(f"🔍 [답변 형식] 테이블 형식 요청 감지")
-    elif any(keyword in last_user_message_lower for keyword in ["리스트로", "목록으로", "리스트 형식", "목록 형식"]):
+        logger.debug("🔍 [답변 형식] 테이블 형식 요청 감지")
+    elif _RE_FMT_LIST.search(last_user_message):
         response_format = "list"
-        print(f"🔍 [답변 형식] 리스트 형식 요청 감지")
+        logger.debug("🔍 [답변 형식] 리스트 형식 요청 감지")
     else:
         response_format = "markdown"  # 기본값
-        print(f"🔍 [답변 형식] 마크다운 형식 (기본값)")
+        logger.debug("🔍 [답변 형식] 마크다운 형식 (기본값)")
     
     # 🆕 검색 필요 여부 체크 (Follow-up 질문인 경우)
     need_research = getattr(response, 'need_research', True)  # 기본값: True (검색 필요)
     if not need_research:
-        print(f"✅ [검색 불필요] 이전 대화 정보만으로 답변 가능 - 검색 건너뛰고 바로 리포트 생성")
+        logger.debug("✅ [검색 불필요] 이전 대화 정보만으로 답변 가능 - 검색 건너뛰고 바로 리포트 생성")
         # 검색 없이 바로 final_report_generation으로 이동
         return Command(
             goto="final_report_generation",
@@ -386,7 +531,7 @@ async def clarify_with_user(
     
     # 명확화 비활성화 시 바로 다음 단계로 (주제 검증은 이미 완료됨)
     if not configurable.allow_clarification:
-        print(f"✅ [DEBUG] 주제 검증 통과 - 바로 연구 시작")
+        logger.debug("✅ [DEBUG] 주제 검증 통과 - 바로 연구 시작")
         return Command(
             goto="write_research_brief",
             update={
@@ -418,37 +563,35 @@ async def clarify_with_user(
 def route_after_research(state: AgentState) -> Literal["structured_report_generation", "final_report_generation", "clarify_missing_constraints", "cannot_answer"]:
     """연구 완료 후 라우팅: Decision Engine 결과 유무와 제약 조건 충분 여부에 따라 분기"""
     
-    import re
-    
     # Decision Engine이 실행되어야 하는 질문인지 확인
     question_type = state.get("question_type", "comparison")
     messages_list = state.get("messages", [])
     
     # 🚨 HumanMessage만 추출 (AI 응답 메시지 제외)
-    human_messages = [msg for msg in messages_list if isinstance(msg, HumanMessage)]
-    all_user_messages_text = " ".join([str(msg.content).lower() for msg in human_messages])
-    last_user_message = str(human_messages[-1].content).lower() if human_messages else ""
+    # 호출자(chat.py)가 대화 이력을 구성하면서 만든 소문자 목록을 우선 사용, 없으면 메시지에서 직접 생성
+    # 메시지별 문자열화/소문자 변환은 한 번만 하고, 마지막 메시지는 그 결과를 재사용
+    # 전체 히스토리를 하나의 문자열로 합치지 않고 메시지별로 검사 (키워드가 발견되면 바로 중단)
+    user_texts_lower = state.get("user_messages_lower")
+    if user_texts_lower is None:
+        user_texts_lower = [str(msg.content).lower() for msg in messages_list if msg.__class__ is _HumanCls]
+    has_user_text = any(user_texts_lower)
+    last_user_message = user_texts_lower[-1] if user_texts_lower else ""
     
     # 🚨 디버깅: 질문 내용과 타입 확인
-    print(f"🔍 [Routing DEBUG] question_type: {question_type}")
-    print(f"🔍 [Routing DEBUG] HumanMessage 개수: {len(human_messages)}")
-    print(f"🔍 [Routing DEBUG] last_user_message: {last_user_message[:100] if last_user_message else 'None'}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("🔍 [Routing DEBUG] question_type: %s", question_type)
+        logger.debug("🔍 [Routing DEBUG] HumanMessage 개수: %s", len(user_texts_lower))
+        logger.debug("🔍 [Routing DEBUG] last_user_message: %.100s", last_user_message or 'None')
     
+    # 키워드 목록 전체를 하나의 정규식으로 한 번만 스캔
+    # ("어떤 도구가 좋을까요", "어떤 도구"+"좋", "vs"/"대비", "최적화"+"도구" 조합은 모두 키워드 자체에 포함됨)
     is_decision_question = (
-        question_type in ["decision", "comparison"] or
-        any(keyword in last_user_message for keyword in [
-            "중 하나만", "하나만", "선택", "어떤 것이", "맞을까", "추천", "어떤 도구", 
-            "좋을까", "적합", "최적화", "어떤게", "뭘", "무엇을", "어떤게 좋", "어떤 것이 좋",
-            "비교", "vs", "대비", "차이", "어떤게 나은", "더 좋은", "어느게", "최적"
-        ]) or
-        "어떤 도구가 좋을까요" in last_user_message or
-        ("어떤 도구" in last_user_message and "좋" in last_user_message) or
-        ("vs" in last_user_message or "대비" in last_user_message) or
-        ("최적화" in last_user_message and "도구" in last_user_message)
+        question_type in _DECISION_QUESTION_TYPES or
+        _RE_DECISION_KEYWORDS.search(last_user_message) is not None
     )
     
     # 🚨 디버깅: Decision 질문 판정 결과
-    print(f"🔍 [Routing DEBUG] is_decision_question: {is_decision_question}")
+    logger.debug("🔍 [Routing DEBUG] is_decision_question: %s", is_decision_question)
     
     # Decision Engine 결과 확인
     decision_result = state.get("decision_result")
@@ -461,39 +604,36 @@ def route_after_research(state: AgentState) -> Literal["structured_report_genera
     
     # 🚨 전체 사용자 메시지 히스토리에서 정보 추출
     has_user_type = False
-    if not team_size and all_user_messages_text:
+    if not team_size and has_user_text:
         # "개인", "개인 개발자", "개인 사용자" 등을 인식하여 team_size = 1로 설정
-        if any(keyword in all_user_messages_text for keyword in ["개인", "개인 개발자", "개인 사용자", "개인용", "개인으로"]):
+        # ("개인 개발자", "개인용" 등 나머지 키워드는 모두 "개인"을 포함하므로 부분 문자열 검사 한 번이면 충분)
+        if _any_contains(user_texts_lower, "개인"):
             team_size = 1
             has_user_type = True
-        elif any(keyword in all_user_messages_text for keyword in ["팀", "팀용", "우리 팀", "팀 규모"]):
+        elif _any_contains(user_texts_lower, "팀"):  # "팀용", "우리 팀", "팀 규모" 모두 "팀"을 포함
             has_user_type = True
             # "X명" 패턴 찾기
-            team_size_match = re.search(r'(\d+)\s*명', all_user_messages_text)
+            team_size_match = _first_search(_RE_TEAM_SIZE, user_texts_lower)
             if team_size_match:
                 team_size = int(team_size_match.group(1))
         else:
             # "X명" 패턴 찾기
-            team_size_match = re.search(r'(\d+)\s*명', all_user_messages_text)
+            team_size_match = _first_search(_RE_TEAM_SIZE, user_texts_lower)
             if team_size_match:
                 team_size = int(team_size_match.group(1))
     
     # 개발 언어/분야 확인 (전체 메시지 히스토리에서)
     has_development_area = False
-    if all_user_messages_text:
-        # 프로그래밍 언어 확인 (하드코딩 - 언어는 정해져 있으므로 OK)
-        languages = ["python", "javascript", "java", "typescript", "c++", "c#", "go", "rust", "php", "ruby", "swift", "kotlin", "dart", "r", "scala", "clojure", "perl", "lua", "matlab"]
-        # 개발 분야 확인
-        domains = ["웹 개발", "백엔드", "프론트엔드", "풀스택", "모바일", "게임", "데이터", "ai", "ml", "머신러닝", "앱 개발"]
-        # 프레임워크/라이브러리 확인 (주요 프레임워크만)
-        frameworks = ["react", "vue", "angular", "django", "flask", "spring", "node.js", "express", "fastapi", "laravel", "rails"]
-        
-        # "~으로 개발", "~로 개발", "~ 개발", "~을 사용" 같은 표현도 포함
-        if any(lang in all_user_messages_text for lang in languages) or \
-           any(domain in all_user_messages_text for domain in domains) or \
-           any(fw in all_user_messages_text for fw in frameworks) or \
-           re.search(r'으로\s*개발|로\s*개발|개발', all_user_messages_text):
+    if has_user_text:
+        # 개발 분야 / "~으로 개발" 표현 (_RE_DEV_AREA 한 번의 스캔) → 없으면 언어/프레임워크 단어 확인
+        if _first_search(_RE_DEV_AREA, user_texts_lower):
             has_development_area = True
+        else:
+            # 문장 끝 마침표가 붙은 단어("python.")도 인식하도록 양끝 '.' 제거
+            # (isdisjoint는 제너레이터를 소비하다 첫 교집합에서 바로 중단)
+            tokens = (token.strip(".") for text in user_texts_lower for token in _RE_ASCII_TOKEN.findall(text))
+            if not _DEV_NAMES.isdisjoint(tokens):
+                has_development_area = True
     
     # 🚨 매우 중요: 기본적으로 정보가 충분하다고 가정!
     # 정말 모호한 경우만 명확화 요구
@@ -505,16 +645,10 @@ def route_after_research(state: AgentState) -> Literal["structured_report_genera
     
     # 정말 모호한 경우 체크 (명확화 필요)
     is_too_vague = False
-    if all_user_messages_text:
-        # 너무 모호한 표현들
-        vague_patterns = [
-            r'나\s*개발\s*할건데',  # "나 개발 할건데"
-            r'개발\s*할건데',  # "개발 할건데"
-            r'개발\s*하려고\s*하는데',  # "개발 하려고 하는데"
-            r'개발\s*하려는데',  # "개발 하려는데"
-        ]
+    if has_user_text:
+        # 너무 모호한 표현들 (_RE_VAGUE_PATTERNS)
         # 모호한 패턴이 있고, 다른 구체적인 정보가 없으면 모호함
-        has_vague_pattern = any(re.search(pattern, all_user_messages_text) for pattern in vague_patterns)
+        has_vague_pattern = any(_first_search(pattern, user_texts_lower) for pattern in _RE_VAGUE_PATTERNS)
         if has_vague_pattern and not has_development_area and not has_user_type and not team_size and not budget_max:
             is_too_vague = True
     
@@ -524,23 +658,24 @@ def route_after_research(state: AgentState) -> Literal["structured_report_genera
         has_user_type or  # 사용 형태가 있으면 충분
         team_size is not None or  # 팀 규모가 있으면 충분
         budget_max is not None or  # 예산이 있으면 충분
-        "코딩" in all_user_messages_text or  # "코딩" 키워드가 있으면 충분
-        "ai" in all_user_messages_text or  # "AI" 키워드가 있으면 충분
-        "도구" in all_user_messages_text  # "도구" 키워드가 있으면 충분 (일반 추천 가능)
+        _any_contains(user_texts_lower, "코딩") or  # "코딩" 키워드가 있으면 충분
+        _any_contains(user_texts_lower, "ai") or  # "AI" 키워드가 있으면 충분
+        _any_contains(user_texts_lower, "도구")  # "도구" 키워드가 있으면 충분 (일반 추천 가능)
     )
     has_sufficient_constraints = team_size is not None or budget_max is not None
     
     # 🚨 디버깅: Decision Engine 결과 확인
-    print(f"🔍 [Routing DEBUG] decision_result 존재: {decision_result is not None}")
-    print(f"🔍 [Routing DEBUG] decision_result 타입: {type(decision_result)}")
-    if decision_result:
-        if isinstance(decision_result, dict):
-            print(f"🔍 [Routing DEBUG] decision_result.keys(): {list(decision_result.keys())}")
-            print(f"🔍 [Routing DEBUG] recommended_tools: {decision_result.get('recommended_tools', [])}")
-        else:
-            print(f"🔍 [Routing DEBUG] decision_result.recommended_tools: {getattr(decision_result, 'recommended_tools', [])}")
-    print(f"🔍 [Routing DEBUG] tool_facts 개수: {len(tool_facts) if tool_facts else 0}")
-    print(f"🔍 [Routing DEBUG] 정보 충분 여부: {has_sufficient_info} (user_type: {has_user_type}, dev_area: {has_development_area}, team_size: {team_size}, budget_max: {budget_max})")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("🔍 [Routing DEBUG] decision_result 존재: %s", decision_result is not None)
+        logger.debug("🔍 [Routing DEBUG] decision_result 타입: %s", type(decision_result))
+        if decision_result:
+            if isinstance(decision_result, dict):
+                logger.debug("🔍 [Routing DEBUG] decision_result.keys(): %s", list(decision_result.keys()))
+                logger.debug("🔍 [Routing DEBUG] recommended_tools: %s", decision_result.get('recommended_tools', []))
+            else:
+                logger.debug("🔍 [Routing DEBUG] decision_result.recommended_tools: %s", getattr(decision_result, 'recommended_tools', []))
+        logger.debug("🔍 [Routing DEBUG] tool_facts 개수: %s", len(tool_facts) if tool_facts else 0)
+        logger.debug("🔍 [Routing DEBUG] 정보 충분 여부: %s (user_type: %s, dev_area: %s, team_size: %s, budget_max: %s)", has_sufficient_info, has_user_type, has_development_area, team_size, budget_max)
     
     if is_decision_question:
         # 🚨 Decision 질문인 경우
@@ -555,27 +690,27 @@ def route_after_research(state: AgentState) -> Literal["structured_report_genera
                 recommended_tools_list = []
             
             recommended_count = len(recommended_tools_list) if recommended_tools_list else 0
-            print(f"🔍 [Routing DEBUG] recommended_count: {recommended_count}")
+            logger.debug("🔍 [Routing DEBUG] recommended_count: %s", recommended_count)
             
             if recommended_count > 0:
-                print(f"✅ [Routing] Decision 질문 + Decision Engine 결과 있음 (추천 {recommended_count}개) → structured_report_generation")
+                logger.info("✅ [Routing] Decision 질문 + Decision Engine 결과 있음 (추천 %s개) → structured_report_generation", recommended_count)
                 return "structured_report_generation"
             else:
                 # Decision Engine 결과는 있지만 추천 도구가 없는 경우: 필터링이 너무 엄격했을 수 있음
-                print(f"⚠️ [Routing DEBUG] Decision Engine 결과는 있지만 추천 도구가 없음 (recommended_tools 빈 리스트)")
-                print(f"⚠️ [Routing] 필터링이 너무 엄격했거나 tool_facts 정보 부족 → final_report_generation (fallback)")
+                logger.warning("⚠️ [Routing DEBUG] Decision Engine 결과는 있지만 추천 도구가 없음 (recommended_tools 빈 리스트)")
+                logger.warning("⚠️ [Routing] 필터링이 너무 엄격했거나 tool_facts 정보 부족 → final_report_generation (fallback)")
                 return "final_report_generation"
         elif not has_sufficient_info:
             # 🚨 개발 언어/분야도 없고 제약 조건도 없으면 명확화 필요
-            print(f"🔍 [Routing] Decision 질문이지만 정보 부족 (user_type: {has_user_type}, dev_area: {has_development_area}, team_size: {team_size}, budget: {budget_max}) → clarify_missing_constraints")
+            logger.info("🔍 [Routing] Decision 질문이지만 정보 부족 (user_type: %s, dev_area: %s, team_size: %s, budget: %s) → clarify_missing_constraints", has_user_type, has_development_area, team_size, budget_max)
             return "clarify_missing_constraints"
         else:
             # 🚨 제약 조건은 없지만 개발 언어/분야가 있으면 충분한 정보!
             # Decision Engine 결과가 없어도 일반 리포트로 추천 제공
-            print(f"✅ [Routing] Decision 질문 + 개발 언어/분야 정보 있음 (제약 조건 없지만 충분) → final_report_generation")
+            logger.info("✅ [Routing] Decision 질문 + 개발 언어/분야 정보 있음 (제약 조건 없지만 충분) → final_report_generation")
             return "final_report_generation"
     else:
         # Discovery 질문인 경우: 일반 리포트 생성 (Decision Engine 불필요)
-        print(f"✅ [Routing] Discovery 질문 → final_report_generation")
+        logger.info("✅ [Routing] Discovery 질문 → final_report_generation")
         return "final_report_generation"
 
@@ -1,30 +1,152 @@
 """연구원 노드 - researcher, researcher_tools"""
 
+import asyncio
+import logging
 import re
-from datetime import datetime
-from typing import Literal
+import time
+import uuid
+from functools import lru_cache
+from typing import Literal, Optional
 
 from app.agent.nodes._common import (
     Command,
     RunnableConfig,
     ResearcherState,
     Configuration,
+    AIMessage,
     HumanMessage,
     SystemMessage,
     ToolMessage,
     configurable_model,
-    DOMAIN_GUIDES,
+    format_domain_guide,
     research_system_prompt,
-    get_today_str,
-    get_current_year,
-    get_current_month_year,
+    get_date_context,
     get_api_key_for_model,
     think_tool,
     searcher,
     vector_store,
+    cached_search_facts,
+    cached_web_search,
 )
 
 
+logger = logging.getLogger(__name__)
+
+# 가격 관련 쿼리 판별 (소문자 변환 + 키워드별 부분 문자열 검사 대신 한 번의 스캔)
+_RE_PRICING_QUERY = re.compile(r"pricing|cost|subscription|plan|가격", re.IGNORECASE)
+
+
+def _format_facts(facts: list) -> str:
+    """Vector DB 검색 결과(Facts)를 연구원에게 전달할 문자열로 포맷팅"""
+    # 결과가 3개 이상이면 충분하다고 판단, 부족하면 웹 검색 필요
+    sufficient = len(facts) >= 3
+    if sufficient:
+        parts = [f"✅ Vector DB에서 {len(facts)}개 관련 정보 발견 (충분함):\n\n"]
+    else:
+        parts = [f"⚠️ Vector DB에서 {len(facts)}개 관련 정보 발견 (부족함, 웹 검색 필요):\n\n"]
+    
+    now_ts = time.time()  # 현재 시각은 한 번만 계산 (datetime 객체 생성 없이 float로)
+    append = parts.append
+    for idx, fact in enumerate(facts, 1):
+        # 필드는 반복마다 한 번씩만 조회해 지역 변수로 사용
+        score = fact['score']
+        text = fact['text']
+        source = fact['source']
+        url = fact.get('url', '')
+        age_days = (now_ts - fact['created_at']) / 86400
+        append(
+            f"{idx}. [신뢰도 {score:.2f}, {age_days:.0f}일 전]\n"
+            f"   {text[:300]}...\n"
+            f"   출처: {source} ({url[:50]}...)\n\n"
+        )
+    
+    if not sufficient:
+        parts.append("추가 정보가 필요합니다. 웹 검색을 사용해주세요.")
+    return "".join(parts)
+
+
+@lru_cache(maxsize=64)
+def _build_researcher_prompt(
+    domain: str, today: str, current_year: str, current_month_year: str
+) -> str:
+    """연구원 시스템 프롬프트 생성 (날짜는 하루 단위로만 바뀌므로 결과 캐싱)"""
+    return research_system_prompt.format(
+        domain=domain,
+        domain_guide=format_domain_guide(domain, today, current_year, current_month_year),
+        date=today,
+        current_year=current_year,
+        current_month_year=current_month_year
+    )
+
+
+# ========== 🆕 연구원 도구 정의 ==========
+# 모델에는 도구 스키마(이름/설명/인자)만 전달되고, 실제 실행은 researcher_tools의 핸들러가
+# 요청별 설정으로 처리함. 직접 호출될 경우에만 아래 기본 설정을 사용
+_DEFAULT_CONFIGURATION = Configuration()
+
+
+async def vector_search(query: str) -> str:
+    """Vector DB에서 Facts 검색 (웹 검색 전 우선 시도)"""
+    configurable = _DEFAULT_CONFIGURATION
+    # threshold를 낮추는 대신 HNSW 탐색 폭(ef)을 넓혀 재현율 확보
+    # 동기 Qdrant/임베딩 호출이므로 스레드에서 실행 (이벤트 루프 블로킹 방지)
+    facts = await asyncio.to_thread(
+        cached_search_facts,
+        query,
+        5,
+        configurable.vector_search_score_threshold,
+        configurable.vector_search_hnsw_ef,
+    )
+    
+    if not facts:
+        return "Vector DB에 관련 정보가 없습니다. 웹 검색이 필요합니다."
+    
+    return _format_facts(facts)
+
+
+async def web_search(query: str) -> str:
+    """웹 검색 도구 (Vector DB에 정보가 없을 때 사용)"""
+    configurable = _DEFAULT_CONFIGURATION
+    result = await cached_web_search(
+        query=query,
+        max_results=configurable.search_max_results,
+        search_depth=configurable.search_depth
+    )
+    
+    if not result["success"]:
+        return f"검색 실패: {result.get('error', '알 수 없는 오류')}"
+    
+    # Vector DB 저장은 researcher_tools에서 한 턴의 검색 결과를 모아 한 번에 처리
+    
+    # 결과 포맷팅
+    parts = [f"검색 결과 ({result['source']}):\n\n"]
+    parts.extend(
+        f"{idx}. {r['title']}\n"
+        f"   URL: {r['url']}\n"
+        f"   내용: {r['content'][:200]}...\n\n"
+        for idx, r in enumerate(result["results"], 1)
+    )
+    return "".join(parts)
+
+
+_RESEARCHER_TOOLS = [vector_search, web_search, think_tool]
+
+
+@lru_cache(maxsize=16)
+def _get_research_model(model: str, max_tokens: int, api_key: Optional[str], max_retries: int):
+    """도구가 바인딩된 연구 모델 (설정이 같으면 bind_tools 스키마 생성 없이 재사용)"""
+    return (
+        configurable_model
+        .bind_tools(_RESEARCHER_TOOLS)
+        .with_retry(stop_after_attempt=max_retries)
+        .with_config({
+            "model": model,
+            "max_tokens": max_tokens,
+            "api_key": api_key,
+        })
+    )
+
+
 async def researcher(
     state: ResearcherState, config: RunnableConfig
 ) -> Command[Literal["researcher_tools"]]:
@@ -32,56 +154,97 @@ async def researcher(
     
     configurable = Configuration.from_runnable_config(config)
     domain = state.get("domain", "AI 서비스")
-    domain_guide = DOMAIN_GUIDES.get(domain, "")
+    researcher_messages = state.get("researcher_messages", [])
     
-    research_model_config = {
-        "model": configurable.research_model,
-        "max_tokens": configurable.research_model_max_tokens,
-        "api_key": get_api_key_for_model(configurable.research_model, config),
-    }
+    # 콜드 스타트 우회: 첫 턴(연구 주제 메시지만 있음) + 도메인 미지정이면
+    # LLM 호출 없이 연구 주제로 vector_search를 바로 실행 (결과를 보고 다음 턴부터 LLM이 판단)
+    research_topic = state.get("research_topic")
+    if (
+        configurable.enable_cold_start_bypass
+        and research_topic
+        and len(researcher_messages) <= 1
+        and domain in (None, "AI 서비스")
+    ):
+        logger.debug("⚡ researcher 콜드 스타트 우회 - vector_search 직접 호출: %.50s", research_topic)
+        response = AIMessage(
+            content="",
+            tool_calls=[{
+                "name": "vector_search",
+                "args": {"query": research_topic},
+                "id": f"call_cold_start_{uuid.uuid4().hex[:12]}",
+                "type": "tool_call",
+            }],
+        )
+        return Command(
+            goto="researcher_tools",
+            update={
+                "researcher_messages": [response],
+                "tool_call_iterations": state.get("tool_call_iterations", 0) + 1
+            }
+        )
     
-    # ========== 🆕 Vector DB 검색 도구 추가 ==========
-    async def vector_search(query: str) -> str:
-        """Vector DB에서 Facts 검색 (웹 검색 전 우선 시도, threshold 완화)"""
-        # threshold를 0.75 → 0.65로 낮춰서 더 많은 결과 가져오기
-        facts = vector_store.search_facts(query, limit=5, score_threshold=0.65)
-        
-        if not facts:
-            return "Vector DB에 관련 정보가 없습니다. 웹 검색이 필요합니다."
-        
-        # 결과가 3개 이상이면 충분하다고 판단
-        if len(facts) >= 3:
-            formatted = f"✅ Vector DB에서 {len(facts)}개 관련 정보 발견 (충분함):\n\n"
-            for idx, fact in enumerate(facts, 1):
-                age_days = (datetime.now().timestamp() - fact['created_at']) / 86400
-                formatted += f"{idx}. [신뢰도 {fact['score']:.2f}, {age_days:.0f}일 전]\n"
-                formatted += f"   {fact['text'][:300]}...\n"
-                formatted += f"   출처: {fact['source']} ({fact.get('url', '')[:50]}...)\n\n"
-            return formatted
-        
-        # 결과가 부족하면 웹 검색 필요
-        formatted = f"⚠️ Vector DB에서 {len(facts)}개 관련 정보 발견 (부족함, 웹 검색 필요):\n\n"
-        for idx, fact in enumerate(facts, 1):
-            age_days = (datetime.now().timestamp() - fact['created_at']) / 86400
-            formatted += f"{idx}. [신뢰도 {fact['score']:.2f}, {age_days:.0f}일 전]\n"
-            formatted += f"   {fact['text'][:300]}...\n"
-            formatted += f"   출처: {fact['source']} ({fact.get('url', '')[:50]}...)\n\n"
-        formatted += "추가 정보가 필요합니다. 웹 검색을 사용해주세요."
-        return formatted
+    research_model = _get_research_model(
+        configurable.research_model,
+        configurable.research_model_max_tokens,
+        get_api_key_for_model(configurable.research_model, config),
+        configurable.max_structured_output_retries,
+    )
+    
+    # 프롬프트는 (도메인, 날짜)가 같으면 동일하므로 캐시된 결과 재사용 (ReAct 반복마다 재포맷팅하지 않음)
+    researcher_prompt = _build_researcher_prompt(domain, *get_date_context())
+    
+    messages = [SystemMessage(content=researcher_prompt)] + researcher_messages
+    response = await research_model.ainvoke(messages)
+    
+    return Command(
+        goto="researcher_tools",
+        update={
+            "researcher_messages": [response],
+            "tool_call_iterations": state.get("tool_call_iterations", 0) + 1
+        }
+    )
+
+
+async def _handle_vector_search(
+    tc: dict, configurable: Configuration, semaphore: asyncio.Semaphore, pending_facts: list
+) -> ToolMessage:
+    """Vector DB 검색 처리"""
+    # threshold를 낮추는 대신 HNSW 탐색 폭(ef)을 넓혀 재현율 확보 (관련 없는 결과로 프롬프트가 길어지는 것 방지)
+    async with semaphore:
+        facts = await asyncio.to_thread(
+            cached_search_facts,
+            tc["args"]["query"],
+            5,
+            configurable.vector_search_score_threshold,
+            configurable.vector_search_hnsw_ef,
+        )
     
-    # 검색 도구 정의
-    async def web_search(query: str) -> str:
-        """웹 검색 도구 (Vector DB에 정보가 없을 때 사용)"""
-        result = await searcher.search(
-            query=query,
+    if facts:
+        content = _format_facts(facts)
+    else:
+        content = "Vector DB에 관련 정보가 없습니다. 웹 검색을 사용해주세요."
+    
+    return ToolMessage(
+        content=content,
+        name="vector_search",
+        tool_call_id=tc["id"]
+    )
+
+
+async def _handle_web_search(
+    tc: dict, configurable: Configuration, semaphore: asyncio.Semaphore, pending_facts: list
+) -> ToolMessage:
+    """웹 검색 처리 (저장할 검색 결과는 pending_facts에 추가)"""
+    # 교차 검증 활성화 (Tavily + Serper Fallback)
+    async with semaphore:
+        result = await cached_web_search(
+            query=tc["args"]["query"],
             max_results=configurable.search_max_results,
-            search_depth=configurable.search_depth
+            enable_verification=True  # 교차 검증 활성화
         )
-        
-        if not result["success"]:
-            return f"검색 실패: {result.get('error', '알 수 없는 오류')}"
-        
-        # ========== 🆕 검색 결과를 Vector DB에 저장 ==========
+    
+    if result["success"]:
+        # ========== 🆕 웹 검색 결과를 Vector DB 저장 대기열에 추가 ==========
         facts_to_store = []
         for r in result["results"]:
             facts_to_store.append({
@@ -90,62 +253,104 @@ async def researcher(
                 "url": r['url'],
                 "metadata": {
                     "score": r.get('score', 0),
-                    "query": query
+                    "query": tc["args"]["query"],
+                    "is_official": r.get('is_official', False)
                 }
             })
         
-        if facts_to_store:
-            vector_store.add_facts(facts_to_store, ttl_days=30)
+        pending_facts.extend(facts_to_store)
         
-        # 결과 포맷팅
-        formatted = f"검색 결과 ({result['source']}):\n\n"
-        for idx, r in enumerate(result["results"], 1):
-            formatted += f"{idx}. {r['title']}\n"
-            formatted += f"   URL: {r['url']}\n"
-            formatted += f"   내용: {r['content'][:200]}...\n\n"
+        source_info = result.get("source", "unknown")
+        if source_info == "verified":
+            verified_info = f"교차 검증됨 (Tavily: {result.get('tavily_count', 0)}개, DuckDuckGo: {result.get('ddg_count', 0)}개 → {result.get('verified_count', 0)}개 검증)"
+        else:
+            verified_info = f"({source_info})"
         
-        return formatted
-    
-    tools = [vector_search, web_search, think_tool]
+        parts = [f"검색 결과 {verified_info}:\n\n"]
+        
+        # 공식 사이트 / 일반 결과를 한 번의 순회로 분류
+        official_results = []
+        other_results = []
+        for r in result["results"]:
+            (official_results if r.get("is_official", False) else other_results).append(r)
+        
+        # 공식 사이트 결과 표시
+        if official_results:
+            parts.append("📌 공식 사이트 결과:\n")
+            parts.extend(
+                f"{idx}. {r['title']}\n   URL: {r['url']}\n   {r['content'][:200]}...\n\n"
+                for idx, r in enumerate(official_results, 1)
+            )
+        
+        # 일반 결과
+        if other_results:
+            if official_results:
+                parts.append("기타 결과:\n")
+            parts.extend(
+                f"{idx}. {r['title']}\n   URL: {r['url']}\n   {r['content'][:200]}...\n\n"
+                for idx, r in enumerate(other_results, len(official_results) + 1)
+            )
+        
+        # 가격 정보 추출 및 표시 (가격 관련 쿼리인 경우)
+        if _RE_PRICING_QUERY.search(tc["args"]["query"]):
+            pricing_info = searcher.extract_pricing_info(result["results"])
+            if pricing_info["pricing"]:
+                parts.append(f"\n💰 추출된 가격 정보 (신뢰도: {pricing_info['confidence']}):\n")
+                parts.extend(
+                    f"- {p['plan']}: {p['price']} (출처: {len(p['sources'])}개, 공식: {p['official_count']}개)\n"
+                    for p in pricing_info["pricing"]
+                )
+        
+        # 문자열 누적(+=) 대신 조각을 모아 한 번에 결합
+        content = "".join(parts)
+    else:
+        content = f"검색 실패: {result.get('error', '알 수 없는 오류')}"
     
-    research_model = (
-        configurable_model
-        .bind_tools(tools)
-        .with_retry(stop_after_attempt=configurable.max_structured_output_retries)
-        .with_config(research_model_config)
+    return ToolMessage(
+        content=content,
+        name="web_search",
+        tool_call_id=tc["id"]
     )
-    
-    # domain_guide도 포맷팅 필요 (current_year 등 포함)
-    try:
-        formatted_domain_guide_researcher = domain_guide.format(
-            date=get_today_str(),
-            current_year=get_current_year(),
-            current_month_year=get_current_month_year()
-        )
-    except KeyError:
-        # 포맷팅 변수가 없으면 그대로 사용
-        formatted_domain_guide_researcher = domain_guide
-    
-    researcher_prompt = research_system_prompt.format(
-        domain=domain,
-        domain_guide=formatted_domain_guide_researcher,
-        date=get_today_str(),
-        current_year=get_current_year(),
-        current_month_year=get_current_month_year()
+
+
+async def _handle_think(
+    tc: dict, configurable: Configuration, semaphore: asyncio.Semaphore, pending_facts: list
+) -> ToolMessage:
+    """think_tool 처리"""
+    return ToolMessage(
+        content=f"사고: {tc['args']['reflection']}",
+        name="think_tool",
+        tool_call_id=tc["id"]
     )
-    
-    messages = [SystemMessage(content=researcher_prompt)] + state.get("researcher_messages", [])
-    response = await research_model.ainvoke(messages)
-    
-    return Command(
-        goto="researcher_tools",
-        update={
-            "researcher_messages": [response],
-            "tool_call_iterations": state.get("tool_call_iterations", 0) + 1
-        }
+
+
+async def _handle_unknown(
+    tc: dict, configurable: Configuration, semaphore: asyncio.Semaphore, pending_facts: list
+) -> ToolMessage:
+    """알 수 없는 tool call에도 응답 (오류 방지)"""
+    return ToolMessage(
+        content=f"도구 '{tc['name']}'는 지원되지 않습니다.",
+        name=tc["name"],
+        tool_call_id=tc["id"]
     )
 
 
+# 도구명 → 처리 함수 (if/elif 체인 대신 dict 조회로 분기)
+_TOOL_HANDLERS = {
+    "vector_search": _handle_vector_search,
+    "web_search": _handle_web_search,
+    "think_tool": _handle_think,
+}
+
+
+async def _dispatch_tool(
+    tc: dict, configurable: Configuration, semaphore: asyncio.Semaphore, pending_facts: list
+) -> ToolMessage:
+    """tool call 하나를 실행하고 ToolMessage로 반환 (저장할 웹 검색 결과는 pending_facts에 추가)"""
+    handler = _TOOL_HANDLERS.get(tc["name"], _handle_unknown)
+    return await handler(tc, configurable, semaphore, pending_facts)
+
+
 async def researcher_tools(
     state: ResearcherState, config: RunnableConfig
 ) -> Command[Literal["researcher", "compress_research"]]:
@@ -159,125 +364,29 @@ async def researcher_tools(
     if not most_recent_message.tool_calls:
         return Command(goto="compress_research")
     
-    # 도구 실행
-    tool_outputs = []
+    # 도구 실행: 한 응답의 여러 tool call을 동시에 실행 (검색 동시 실행 수는 Semaphore로 제한)
+    tool_calls = most_recent_message.tool_calls
+    semaphore = asyncio.Semaphore(configurable.max_concurrent_searches)
+    pending_facts = []  # 이번 턴의 웹 검색 결과 (마지막에 한 번에 저장)
+    results = await asyncio.gather(
+        *(_dispatch_tool(tc, configurable, semaphore, pending_facts) for tc in tool_calls),
+        return_exceptions=True,
+    )
     
-    for tc in most_recent_message.tool_calls:
-        # ========== 🆕 Vector DB 검색 처리 ==========
-        if tc["name"] == "vector_search":
-            # threshold를 0.75 → 0.65로 낮춰서 더 많은 결과 가져오기
-            facts = vector_store.search_facts(tc["args"]["query"], limit=5, score_threshold=0.65)
-            
-            if facts:
-                # 결과가 3개 이상이면 충분하다고 판단
-                if len(facts) >= 3:
-                    formatted = f"✅ Vector DB에서 {len(facts)}개 관련 정보 발견 (충분함):\n\n"
-                    for idx, fact in enumerate(facts, 1):
-                        age_days = (datetime.now().timestamp() - fact['created_at']) / 86400
-                        formatted += f"{idx}. [신뢰도 {fact['score']:.2f}, {age_days:.0f}일 전]\n"
-                        formatted += f"   {fact['text'][:300]}...\n"
-                        formatted += f"   출처: {fact['source']} ({fact.get('url', '')[:50]}...)\n\n"
-                    content = formatted
-                else:
-                    # 결과가 부족하면 웹 검색 필요
-                    formatted = f"⚠️ Vector DB에서 {len(facts)}개 관련 정보 발견 (부족함, 웹 검색 필요):\n\n"
-                    for idx, fact in enumerate(facts, 1):
-                        age_days = (datetime.now().timestamp() - fact['created_at']) / 86400
-                        formatted += f"{idx}. [신뢰도 {fact['score']:.2f}, {age_days:.0f}일 전]\n"
-                        formatted += f"   {fact['text'][:300]}...\n"
-                        formatted += f"   출처: {fact['source']} ({fact.get('url', '')[:50]}...)\n\n"
-                    formatted += "추가 정보가 필요합니다. 웹 검색을 사용해주세요."
-                    content = formatted
-            else:
-                content = "Vector DB에 관련 정보가 없습니다. 웹 검색을 사용해주세요."
-            
-            tool_outputs.append(ToolMessage(
-                content=content,
-                name="vector_search",
-                tool_call_id=tc["id"]
-            ))
-        
-        elif tc["name"] == "web_search":
-            # 교차 검증 활성화 (Tavily + Serper Fallback)
-            result = await searcher.search(
-                query=tc["args"]["query"],
-                max_results=configurable.search_max_results,
-                enable_verification=True  # 교차 검증 활성화
-            )
-            
-            if result["success"]:
-                # ========== 🆕 웹 검색 결과를 Vector DB에 저장 ==========
-                facts_to_store = []
-                for r in result["results"]:
-                    facts_to_store.append({
-                        "text": f"{r['title']}: {r['content']}",
-                        "source": result['source'],
-                        "url": r['url'],
-                        "metadata": {
-                            "score": r.get('score', 0),
-                            "query": tc["args"]["query"],
-                            "is_official": r.get('is_official', False)
-                        }
-                    })
-                
-                if facts_to_store:
-                    vector_store.add_facts(facts_to_store, ttl_days=30)
-                
-                source_info = result.get("source", "unknown")
-                if source_info == "verified":
-                    verified_info = f"교차 검증됨 (Tavily: {result.get('tavily_count', 0)}개, DuckDuckGo: {result.get('ddg_count', 0)}개 → {result.get('verified_count', 0)}개 검증)"
-                else:
-                    verified_info = f"({source_info})"
-                
-                formatted = f"검색 결과 {verified_info}:\n\n"
-                
-                # 공식 사이트 결과 표시
-                official_results = [r for r in result["results"] if r.get("is_official", False)]
-                if official_results:
-                    formatted += "📌 공식 사이트 결과:\n"
-                    for idx, r in enumerate(official_results, 1):
-                        formatted += f"{idx}. {r['title']}\n   URL: {r['url']}\n   {r['content'][:200]}...\n\n"
-                
-                # 일반 결과
-                other_results = [r for r in result["results"] if not r.get("is_official", False)]
-                if other_results:
-                    if official_results:
-                        formatted += "기타 결과:\n"
-                    for idx, r in enumerate(other_results, len(official_results) + 1):
-                        formatted += f"{idx}. {r['title']}\n   URL: {r['url']}\n   {r['content'][:200]}...\n\n"
-                
-                # 가격 정보 추출 및 표시 (가격 관련 쿼리인 경우)
-                if any(kw in tc["args"]["query"].lower() for kw in ["pricing", "cost", "subscription", "plan", "가격"]):
-                    pricing_info = searcher.extract_pricing_info(result["results"])
-                    if pricing_info["pricing"]:
-                        formatted += f"\n💰 추출된 가격 정보 (신뢰도: {pricing_info['confidence']}):\n"
-                        for p in pricing_info["pricing"]:
-                            formatted += f"- {p['plan']}: {p['price']} (출처: {len(p['sources'])}개, 공식: {p['official_count']}개)\n"
-                
-                content = formatted
-            else:
-                content = f"검색 실패: {result.get('error', '알 수 없는 오류')}"
-            
-            tool_outputs.append(ToolMessage(
-                content=content,
-                name="web_search",
-                tool_call_id=tc["id"]
-            ))
-        
-        elif tc["name"] == "think_tool":
-            tool_outputs.append(ToolMessage(
-                content=f"사고: {tc['args']['reflection']}",
-                name="think_tool",
-                tool_call_id=tc["id"]
-            ))
-        
-        else:
-            # 알 수 없는 tool call에도 응답 (오류 방지)
-            tool_outputs.append(ToolMessage(
-                content=f"도구 '{tc['name']}'는 지원되지 않습니다.",
+    # tool call 순서대로 결과 정리 (예외도 ToolMessage로 응답해 오류 방지)
+    tool_outputs = []
+    for tc, result in zip(tool_calls, results):
+        if isinstance(result, BaseException):
+            result = ToolMessage(
+                content=f"도구 '{tc['name']}' 실행 실패: {result}",
                 name=tc["name"],
                 tool_call_id=tc["id"]
-            ))
+            )
+        tool_outputs.append(result)
+    
+    # 웹 검색 결과를 Vector DB에 한 번에 저장 (검색마다 upsert하지 않고 배치로)
+    if pending_facts:
+        await asyncio.to_thread(vector_store.add_facts, pending_facts, 30)
     
     # 종료 조건
     exceeded = state.get("tool_call_iterations", 0) >= configurable.max_react_tool_calls
@@ -1,6 +1,7 @@
 """연구 슈퍼바이저 노드 - supervisor, supervisor_tools"""
 
 import asyncio
+import logging
 from typing import Literal
 
 from app.agent.nodes._common import (
@@ -17,9 +18,52 @@ from app.agent.nodes._common import (
     think_tool,
     get_api_key_for_model,
     get_notes_from_tool_calls,
+    cancel_tasks,
 )
 
 
+logger = logging.getLogger(__name__)
+
+
+def _handle_think(tc: dict) -> ToolMessage:
+    """think_tool 처리"""
+    return ToolMessage(
+        content=f"사고 기록: {tc['args']['reflection']}",
+        name="think_tool",
+        tool_call_id=tc["id"]
+    )
+
+
+def _handle_complete(tc: dict) -> ToolMessage:
+    """ResearchComplete 처리"""
+    return ToolMessage(
+        content="연구 완료 확인",
+        name="ResearchComplete",
+        tool_call_id=tc["id"]
+    )
+
+
+def _handle_unknown(tc: dict) -> ToolMessage:
+    """알 수 없는 tool call에도 응답 (오류 방지)"""
+    return ToolMessage(
+        content=f"도구 '{tc['name']}'는 지원되지 않습니다.",
+        name=tc["name"],
+        tool_call_id=tc["id"]
+    )
+
+
+# 도구명 → 처리 함수 (ConductResearch는 supervisor_tools에서 일괄 병렬 처리)
+_TOOL_HANDLERS = {
+    "think_tool": _handle_think,
+    "ResearchComplete": _handle_complete,
+}
+
+
+async def _with_index(idx: int, coro):
+    """코루틴 결과를 (인덱스, 결과)로 반환 (as_completed 후 원래 순서 복원용)"""
+    return idx, await coro
+
+
 async def supervisor(
     state: SupervisorState, config: RunnableConfig
 ) -> Command[Literal["supervisor_tools"]]:
@@ -67,23 +111,34 @@ async def supervisor_tools(
     # 종료 조건
     exceeded_iterations = research_iterations > configurable.max_researcher_iterations
     no_tool_calls = not most_recent_message.tool_calls
-    research_complete_called = any(
-        tc["name"] == "ResearchComplete" for tc in most_recent_message.tool_calls
-    )
+    
+    # tool_calls는 한 번만 순회해 분류 (ConductResearch는 일괄 처리, 나머지는 순서 유지)
+    conduct_calls = []
+    other_calls = []
+    research_complete_called = False
+    for tc in most_recent_message.tool_calls:
+        name = tc["name"]
+        if name == "ConductResearch":
+            conduct_calls.append(tc)
+        else:
+            if name == "ResearchComplete":
+                research_complete_called = True
+            other_calls.append(tc)
     
     if exceeded_iterations or no_tool_calls or research_complete_called:
         # notes 추출 (모든 ToolMessage에서 추출)
         notes = get_notes_from_tool_calls(supervisor_messages)
         
         # 디버깅: notes 확인
-        print(f"🔍 [DEBUG] supervisor_tools 종료 - notes 개수: {len(notes)}")
-        print(f"🔍 [DEBUG] notes 내용: {notes[:2] if notes else '없음'}")
+        logger.debug("🔍 supervisor_tools 종료 - notes 개수: %d", len(notes))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("🔍 notes 내용: %s", notes[:2] if notes else "없음")
         
         # notes가 비어있으면 raw_notes에서 추출 시도
         if not notes:
             raw_notes = state.get("raw_notes", [])
             if raw_notes:
-                print(f"🔍 [DEBUG] raw_notes에서 notes 추출 시도: {len(raw_notes)}개")
+                logger.debug("🔍 raw_notes에서 notes 추출 시도: %d개", len(raw_notes))
                 notes = raw_notes if isinstance(raw_notes, list) else [raw_notes]
         
         return Command(
@@ -98,62 +153,56 @@ async def supervisor_tools(
     all_tool_messages = []
     update_payload = {"supervisor_messages": []}
     
-    # 모든 tool_calls 처리
-    for tc in most_recent_message.tool_calls:
-        if tc["name"] == "think_tool":
-            all_tool_messages.append(ToolMessage(
-                content=f"사고 기록: {tc['args']['reflection']}",
-                name="think_tool",
-                tool_call_id=tc["id"]
-            ))
-        
-        elif tc["name"] == "ConductResearch":
-            # 나중에 일괄 처리
-            pass
-        
-        elif tc["name"] == "ResearchComplete":
-            all_tool_messages.append(ToolMessage(
-                content="연구 완료 확인",
-                name="ResearchComplete",
-                tool_call_id=tc["id"]
-            ))
-        
-        else:
-            # 알 수 없는 tool call에도 응답 (오류 방지)
-            all_tool_messages.append(ToolMessage(
-                content=f"도구 '{tc['name']}'는 지원되지 않습니다.",
-                name=tc["name"],
-                tool_call_id=tc["id"]
-            ))
+    # ConductResearch 외 tool_calls 처리
+    for tc in other_calls:
+        handler = _TOOL_HANDLERS.get(tc["name"], _handle_unknown)
+        all_tool_messages.append(handler(tc))
     
     # ConductResearch 일괄 처리
-    conduct_calls = [tc for tc in most_recent_message.tool_calls if tc["name"] == "ConductResearch"]
-    
     if conduct_calls:
         # researcher_subgraph import (순환 참조 방지)
         from app.agent.graph import researcher_subgraph
         
-        allowed_calls = conduct_calls[:configurable.max_concurrent_research_units]
-        skipped_calls = conduct_calls[configurable.max_concurrent_research_units:]
-        
-        # 병렬 연구 실행
-        tasks = [
-            researcher_subgraph.ainvoke({
-                "researcher_messages": [HumanMessage(content=tc["args"]["research_topic"])],
-                "research_topic": tc["args"]["research_topic"],
-                "domain": state.get("domain")
-            }, config)
-            for tc in allowed_calls
-        ]
+        # 동시 실행 수만큼씩 나눠 여러 wave로 실행 (초과분을 다음 슈퍼바이저 반복으로 미루지 않음)
+        wave_size = max(1, configurable.max_concurrent_research_units)
+        allowed_count = wave_size * max(1, configurable.max_research_waves_per_turn)
+        allowed_calls = conduct_calls[:allowed_count]
+        skipped_calls = conduct_calls[allowed_count:]
         
-        results = await asyncio.gather(*tasks)
+        research_messages = [None] * len(allowed_calls)
+        # raw_notes도 tool_call 인덱스별로 모아 완료 순서와 무관하게 같은 순서로 합침 (리포트 입력 결정성 유지)
+        raw_notes_by_call = [()] * len(allowed_calls)
+        for wave_start in range(0, len(allowed_calls), wave_size):
+            # 병렬 연구 실행 (먼저 끝난 연구부터 결과 처리)
+            tasks = [
+                asyncio.create_task(_with_index(idx, researcher_subgraph.ainvoke({
+                    "researcher_messages": [HumanMessage(content=tc["args"]["research_topic"])],
+                    "research_topic": tc["args"]["research_topic"],
+                    "domain": state.get("domain")
+                }, config)))
+                for idx, tc in enumerate(allowed_calls[wave_start:wave_start + wave_size], wave_start)
+            ]
+            
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    idx, observation = await next_done
+                    tc = allowed_calls[idx]
+                    research_messages[idx] = ToolMessage(
+                        content=observation.get("compressed_research", "연구 실패"),
+                        name=tc["name"],
+                        tool_call_id=tc["id"]
+                    )
+                    
+                    # raw_notes 수집 (compress_research가 항상 리스트로 반환하므로 타입 분기 없이 저장)
+                    raw_notes_by_call[idx] = observation.get("raw_notes") or ()
+            except BaseException:
+                # 한 연구가 실패하거나 supervisor_tools 자체가 취소되면 남은 연구도 취소 (gather와 동일하게 백그라운드 실행 방지)
+                cancel_tasks(*tasks)
+                raise
         
-        for observation, tc in zip(results, allowed_calls):
-            all_tool_messages.append(ToolMessage(
-                content=observation.get("compressed_research", "연구 실패"),
-                name=tc["name"],
-                tool_call_id=tc["id"]
-            ))
+        # ToolMessage와 raw_notes는 tool_call 순서대로 추가
+        all_tool_messages.extend(research_messages)
+        raw_notes_list = [note for notes in raw_notes_by_call for note in notes]
         
         # 제한 초과로 건너뛴 호출에도 응답 (오류 방지)
         for tc in skipped_calls:
@@ -163,19 +212,9 @@ async def supervisor_tools(
                 tool_call_id=tc["id"]
             ))
         
-        # raw_notes 수집
-        raw_notes_list = []
-        for obs in results:
-            obs_raw_notes = obs.get("raw_notes", [])
-            if obs_raw_notes:
-                if isinstance(obs_raw_notes, list):
-                    raw_notes_list.extend(obs_raw_notes)
-                else:
-                    raw_notes_list.append(str(obs_raw_notes))
-        
         if raw_notes_list:
             update_payload["raw_notes"] = raw_notes_list
-            print(f"🔍 [DEBUG] raw_notes 수집: {len(raw_notes_list)}개")
+            logger.debug("🔍 raw_notes 수집: %d개", len(raw_notes_list))
     
     update_payload["supervisor_messages"] = all_tool_messages
     return Command(goto="supervisor", update=update_payload)
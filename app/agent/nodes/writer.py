@@ -1,41 +1,175 @@
 """리포트 생성 노드 (최종 리포트, 구조화된 리포트)"""
 
+import asyncio
+import re
+from functools import lru_cache
+from typing import Optional
+
 from app.agent.nodes._common import *
 
+# 리포트 본문에서 추천 도구명을 추출하는 패턴 (모듈 로드 시 한 번만 컴파일)
+# 📊 / ## 📊 / N순위 / 최종 추천 패턴을 하나의 alternation으로 합쳐 본문을 한 번만 스캔
+# (## 📊 가 📊 보다 먼저 와야 헤딩 전체가 하나의 매치로 처리됨)
+_RE_TOOLS_ALL = re.compile(
+    r'##\s+📊\s+(?P<heading>[^\n]+)'
+    r'|📊\s+(?P<emoji>[^\n]+)'
+    r'|\*\*[0-9]+순위:\s*(?P<rank>[^\*]+)\*\*'
+    r'|\*\*최종 추천:\s*(?P<final>[^\*]+)\*\*'
+)
+# _RE_TOOLS_ALL이 매치되려면 반드시 포함되어야 하는 문자열 (사전 체크용)
+_TOOL_MARKERS = ("📊", "순위:", "최종 추천:")
 
-async def generate_greeting_dynamically(
-    messages_list: list,
-    config: RunnableConfig,
-    is_followup: bool = False,
-    max_retries: int = 3
-) -> str:
-    """LLM을 사용하여 사용자 질문에 맞는 동적 인사 멘트 생성"""
-    
-    configurable = Configuration.from_runnable_config(config)
-    last_user_message = messages_list[-1].content if messages_list and isinstance(messages_list[-1], HumanMessage) else ""
-    messages_context = get_buffer_string(messages_list) if messages_list else last_user_message
-    
-    # 모델별 max_tokens 제한 확인 및 적용
-    greeting_model_name = configurable.final_report_model.lower()
-    if "gpt-4o-mini" in greeting_model_name:
-        greeting_max_tokens = min(configurable.final_report_model_max_tokens, 16384)
-    elif "gpt-4o" in greeting_model_name and "mini" not in greeting_model_name:
-        greeting_max_tokens = min(configurable.final_report_model_max_tokens, 16384)
-    elif "gpt-4" in greeting_model_name:
-        greeting_max_tokens = min(configurable.final_report_model_max_tokens, 4096)
-    else:
-        greeting_max_tokens = min(configurable.final_report_model_max_tokens, 16384)
+# Follow-up 질문 시 이전 AI 답변에서 도구명을 추출하는 패턴 (메시지마다 반복 사용되므로 모듈 로드 시 한 번만 컴파일)
+# 패턴별로 따로 스캔: 📊 패턴은 줄 끝까지 소비하므로 하나의 alternation으로 합치면
+# 같은 줄의 N순위/추천하는 도구 등 겹치는 매치가 누락됨 (대신 마커 문자열이 없는 패턴은 스캔 생략)
+_RE_FOLLOWUP_EMOJI = re.compile(r'📊\s+([^\n]+)')                              # 📊 [도구명]
+_RE_FOLLOWUP_HEADER = re.compile(r'##\s+📊\s+([^\n]+)')                        # ## 📊 [도구명]
+_RE_FOLLOWUP_RANK = re.compile(r'\*\*[0-9]+순위:\s*([^\*]+)\*\*')              # **1순위: [도구명]**
+_RE_FOLLOWUP_FINAL = re.compile(r'\*\*최종 추천:\s*([^\*]+)\*\*')               # **최종 추천: [도구명]**
+_RE_FOLLOWUP_RECOMMENDED = re.compile(r'(?:가장\s+)?추천하는\s+도구:\s*([^\n\.]+)')  # (가장) 추천하는 도구: [도구명]
+_RE_FOLLOWUP_ALTERNATIVE = re.compile(r'대안\s*[0-9]+:\s*([^\n\.]+)')             # 대안 1: [도구명]
+# 💡 추천 섹션 (섹션 안에서만 대표 도구명을 찾음)
+_RE_FOLLOWUP_REC_SECTION = re.compile(r'💡[^\n]*(?:추천[^\n]*)')
+_RE_FOLLOWUP_BEST = re.compile(r'가장\s+추천하는\s+도구:\s*([^\n\.]+)')
+_RE_FOLLOWUP_TOOL_NAMES = re.compile(
+    r'\b(GitHub\s+Copilot|Cursor|Codeium|Tabnine|Aider|Replit|Cline|Windsurf|CodeRabbit|DeepCode|JetBrains\s+AI\s+Assistant|CodeAnt|Qodo|Codacy)\b',
+    re.IGNORECASE,
+)
+# 도구명 끝의 괄호/가격/공백 제거, 중복 비교용 정제 (괄호/가격/공백 전체 제거)
+_RE_TOOL_TRAILING = re.compile(r'[\(\)\[\]월\s\$0-9/]+$')
+_RE_TOOL_NOISE = re.compile(r'[\(\)\[\]월\s\$0-9]+')
+# 인사 멘트 양 끝에서 제거할 공백/따옴표 (한 번의 strip으로 처리, 본문 안의 따옴표는 유지)
+# 공백은 인자 없는 str.strip()과 동일하게 유니코드 공백 전체 포함 (U+00A0, U+3000 등 - 최대값은 U+3000)
+_GREETING_STRIP_CHARS = "\"'`" + "".join(ch for ch in map(chr, range(0x3001)) if ch.isspace())
+# [GREETING]...[/GREETING] 블록 (여러 줄 포함)
+_RE_GREETING_BLOCK = re.compile(r'\[GREETING\](.*?)\[/GREETING\]', re.DOTALL)
+
+# 모델별 max_tokens 상한 (부분 문자열 매칭, 더 구체적인 이름이 먼저 오도록 순서 유지)
+_MODEL_MAX_TOKENS = {"gpt-4o-mini": 16384, "gpt-4o": 16384, "gpt-4": 4096}
+# 구조화된 리포트는 gpt-4o도 4096으로 제한
+_STRUCTURED_MODEL_MAX_TOKENS = {"gpt-4o-mini": 16384, "gpt-4o": 4096, "gpt-4": 4096}
+_DEFAULT_MAX_TOKENS = 16384
+
+
+def _max_tokens_for(model: str, configured: int, caps: dict = _MODEL_MAX_TOKENS) -> int:
+    """모델 이름에 맞는 max_tokens 반환 (설정값과 모델 상한 중 작은 값)"""
+    model_name = model.lower()
+    for prefix, cap in caps.items():
+        if prefix in model_name:
+            return min(configured, cap)
+    return min(configured, _DEFAULT_MAX_TOKENS)
+
+
+def _is_too_short(text: str, min_len: int = 50) -> bool:
+    """앞뒤 공백을 제외한 길이가 min_len 미만인지 확인 (len(text.strip()) < min_len과 동일, 긴 문자열은 복사 없이 판단)"""
+    if not text or len(text) < min_len:
+        return True
+    # 양 끝이 공백이 아니면 strip()해도 길이가 그대로이므로 복사 생략
+    if not text[0].isspace() and not text[-1].isspace():
+        return False
+    return len(text.strip()) < min_len
+
+
+@lru_cache(maxsize=256)
+def _format_constraints(frozen: tuple) -> str:
+    """제약 조건을 프롬프트용 문자열로 포맷팅 (frozen: 정렬된 (키, 값) 튜플)"""
+    if not frozen:
+        return "제약 조건 없음"
     
-    greeting_model_config = {
-        "model": configurable.final_report_model,
-        "max_tokens": greeting_max_tokens,
-        "api_key": get_api_key_for_model(configurable.final_report_model, config),
-    }
+    constraints = dict(frozen)
+    constraints_text = "**🚨 하드 제약 조건 (반드시 준수해야 함):**\n\n"
+    if constraints.get("budget_max"):
+        constraints_text += f"- 최대 예산: {constraints['budget_max']:,}원\n"
+    if constraints.get("security_required"):
+        constraints_text += f"- 보안/프라이버시: 필수 (외부 서버 전송 금지)\n"
+    if constraints.get("excluded_tools"):
+        constraints_text += f"- **제외할 도구 (절대 추천 금지)**: {', '.join(constraints['excluded_tools'])}\n"
+    if constraints.get("excluded_features"):
+        constraints_text += f"- **금지된 기능**: {', '.join(constraints['excluded_features'])}\n"
+    if constraints.get("team_size"):
+        constraints_text += f"- 팀 규모: {constraints['team_size']}명\n"
+    if constraints.get("must_support_ide"):
+        constraints_text += f"- 필수 지원 IDE: {', '.join(constraints['must_support_ide'])}\n"
+    if constraints.get("must_support_language"):
+        constraints_text += f"- 필수 지원 언어: {', '.join(constraints['must_support_language'])}\n"
+    if constraints.get("other_requirements"):
+        constraints_text += f"- 기타 요구사항: {', '.join(constraints['other_requirements'])}\n"
+    constraints_text += "\n**⚠️ 중요**: 위 제약 조건을 위반하는 도구는 추천 목록에서 완전히 제외해야 합니다. 단순히 언급하거나 설명만 하는 것이 아니라, 아예 추천하지 마세요.\n"
+    return constraints_text
+
+
+def _constraints_text_for(constraints: Optional[dict]) -> str:
+    """제약 조건 dict를 해시 가능한 키로 바꿔 _format_constraints 캐시 조회"""
+    if not constraints:
+        return _format_constraints(())
+    key = tuple(sorted(
+        (k, tuple(v) if isinstance(v, list) else v) for k, v in constraints.items()
+    ))
+    try:
+        return _format_constraints(key)
+    except TypeError:
+        # 해시할 수 없는 값(dict 등)이 섞여 있으면 캐시 없이 포맷팅
+        return _format_constraints.__wrapped__(key)
+
+
+# 응답 이후 실행되는 캐시 저장 태스크 (GC로 중간에 사라지지 않도록 참조 유지)
+_background_tasks: set = set()
+
+
+async def _persist_final_report(
+    cache_key: str,
+    content: str,
+    domain: str,
+    last_user_message: str,
+    normalized_text: str,
+) -> None:
+    """최종 답변 캐시 저장과 질문-캐시 키 매핑 저장을 동시에 실행 (서로 독립적인 I/O)"""
+    writes = [
+        asyncio.to_thread(research_cache.set, cache_key, {"content": content}, domain=domain, prefix="final")
+    ]
+    # 원본 질문이 있을 때만 벡터 DB에 매핑 저장 (유사 질문 검색용)
+    if last_user_message:
+        writes.append(asyncio.to_thread(
+            vector_store.add_query_mapping,
+            query=last_user_message,
+            cache_key=cache_key,
+            normalized_text=normalized_text,
+            domain=domain,
+            ttl_days=7
+        ))
     
-    greeting_prompt = f"""당신은 코딩 AI 도구 추천 전문가입니다. 사용자 질문에 맞는 자연스럽고 상세한 인사 멘트를 생성하세요.
+    results = await asyncio.gather(*writes, return_exceptions=True)
+    failed = False
+    for result in results:
+        if isinstance(result, Exception):
+            failed = True
+            print(f"⚠️ [캐시 저장] 백그라운드 저장 실패: {result}")
+    if not failed:
+        print(f"✅ [캐시 저장] 최종 답변/질문 매핑 저장 완료 (캐시키: {cache_key[:16]}..., TTL: 7일)")
 
-사용자 메시지:
-{messages_context}
+
+def _schedule_final_report_persist(
+    cache_key: str,
+    content: str,
+    domain: str,
+    last_user_message: str,
+    normalized_text: str,
+) -> None:
+    """캐시 저장을 백그라운드 태스크로 예약 (응답 반환을 기다리게 하지 않음)"""
+    task = asyncio.create_task(_persist_final_report(
+        cache_key=cache_key,
+        content=content,
+        domain=domain,
+        last_user_message=last_user_message,
+        normalized_text=normalized_text,
+    ))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+# 인사 멘트 생성 프롬프트 (정적 부분은 모듈 로드 시 한 번만 생성, 호출 시 대화 이력만 채움)
+# 대화 이력은 맨 끝에 두어 고정 지침 부분이 요청 간 동일한 prefix로 유지되도록 함 (프롬프트 prefix 캐싱)
+_GREETING_PROMPT_TEMPLATE = """당신은 코딩 AI 도구 추천 전문가입니다. 맨 아래 사용자 메시지에 맞는 자연스럽고 상세한 인사 멘트를 생성하세요.
 
 **원칙:**
 - 사용자의 현재 질문 내용과 의도를 정확히 파악하여 그에 맞는 자연스러운 멘트를 생성
@@ -60,43 +194,112 @@ async def generate_greeting_dynamically(
 - "AI 도구로 생산성을 높여드리겠습니다." (너무 짧고 구체적이지 않음)
 - "네! 조사해드리겠습니다." (너무 일반적)
 
-인사 멘트만 출력하세요 ([GREETING] 태그 없이, 다른 설명 없이):"""
+인사 멘트만 출력하세요 ([GREETING] 태그 없이, 다른 설명 없이).
+
+사용자 메시지:
+{messages_context}"""
+
+_GREETING_RETRY_TEMPLATE = """당신은 코딩 AI 도구 추천 전문가입니다.
+
+아래 질문에 맞는 자연스럽고 상세한 인사 멘트를 생성하세요. 질문의 핵심 내용(팀 규모, 목적, 요구사항 등)을 구체적으로 반영한 40-100자 정도의 상세한 인사 멘트를 작성해주세요.
+
+인사 멘트만 출력하세요.
+
+사용자 메시지:
+{messages_context}"""
+
+
+# 인사 멘트 Redis 캐시 (첫 질문이 같으면 같은 멘트 재사용)
+_GREETING_CACHE_TTL_SECONDS = 86400
+
+
+def extract_recommended_tools(content: str) -> list:
+    """리포트 본문에서 추천 도구명 후보 추출 (단일 스캔)"""
+    # 마커 문자열이 하나도 없으면 정규식 스캔 생략 (부분 문자열 검색이 훨씬 저렴)
+    if not any(marker in content for marker in _TOOL_MARKERS):
+        return []
+    return [match.group(match.lastgroup).strip() for match in _RE_TOOLS_ALL.finditer(content)]
+
+
+async def generate_greeting_dynamically(
+    messages_list: list,
+    config: RunnableConfig,
+    is_followup: bool = False,
+    max_retries: int = 3,
+    messages_context: str = None
+) -> str:
+    """LLM을 사용하여 사용자 질문에 맞는 동적 인사 멘트 생성
+    
+    messages_context: 호출자가 이미 직렬화한 대화 이력 (없으면 여기서 get_buffer_string으로 생성)
+    """
+    
+    configurable = Configuration.from_runnable_config(config)
+    if messages_context is None:
+        last_user_message = messages_list[-1].content if messages_list and isinstance(messages_list[-1], HumanMessage) else ""
+        messages_context = get_buffer_string(messages_list) if messages_list else last_user_message
+    
+    # 모델별 max_tokens 제한 확인 및 적용
+    greeting_max_tokens = _max_tokens_for(configurable.final_report_model, configurable.final_report_model_max_tokens)
+    
+    greeting_model_config = {
+        "model": configurable.final_report_model,
+        "max_tokens": greeting_max_tokens,
+        "api_key": get_api_key_for_model(configurable.final_report_model, config),
+    }
+    
+    # 새 세션의 첫 질문(메시지 1개)은 같은 질문이면 같은 멘트로 충분하므로 Redis 캐시 우선 조회
+    # Follow-up 멘트는 이전 대화 맥락에 의존하므로 다른 세션의 멘트가 섞이지 않도록 캐시하지 않음
+    greeting_cache_key = None
+    if not is_followup and messages_list and len(messages_list) == 1:
+        last_message = messages_list[0]
+        if isinstance(last_message, HumanMessage) and last_message.content:
+            greeting_cache_key = f"{configurable.final_report_model}|{str(last_message.content).strip().lower()}"
+            cached = await asyncio.to_thread(research_cache.get, greeting_cache_key, "general", "greeting")
+            if cached and cached.get("greeting"):
+                print(f"✅ [Greeting Generation] 캐시된 멘트 사용: '{cached['greeting']}'")
+                return cached["greeting"]
+    
+    greeting_prompt = _GREETING_PROMPT_TEMPLATE.format(messages_context=messages_context)
     
     for attempt in range(max_retries):
         try:
             greeting_model = configurable_model.with_config(greeting_model_config)
             greeting_response = await greeting_model.ainvoke([HumanMessage(content=greeting_prompt)])
-            greeting = str(greeting_response.content).strip().strip('"\'`').strip()
+            greeting = str(greeting_response.content).strip(_GREETING_STRIP_CHARS)
+            greeting_len = len(greeting)
             
             # 응답이 너무 짧으면 재시도
-            if not greeting or len(greeting) < 30:
+            if greeting_len < 30:
                 if attempt < max_retries - 1:
-                    print(f"⚠️ [Greeting Generation] LLM 응답이 너무 짧음 ({len(greeting) if greeting else 0}자), 재시도 {attempt + 1}/{max_retries}")
-                    retry_prompt = f"""당신은 코딩 AI 도구 추천 전문가입니다.
-
-사용자 메시지:
-{messages_context}
-
-위 질문에 맞는 자연스럽고 상세한 인사 멘트를 생성하세요. 질문의 핵심 내용(팀 규모, 목적, 요구사항 등)을 구체적으로 반영한 40-100자 정도의 상세한 인사 멘트를 작성해주세요.
-
-인사 멘트만 출력하세요:"""
+                    print(f"⚠️ [Greeting Generation] LLM 응답이 너무 짧음 ({greeting_len}자), 재시도 {attempt + 1}/{max_retries}")
+                    retry_prompt = _GREETING_RETRY_TEMPLATE.format(messages_context=messages_context)
                     greeting_prompt = retry_prompt
                     continue
                 else:
                     # 마지막 시도도 실패하면 빈 문자열 반환 (호출자가 처리)
-                    print(f"⚠️ [Greeting Generation] LLM 응답이 계속 짧음 ({len(greeting) if greeting else 0}자), 재시도 실패")
-                    return greeting if greeting else ""
+                    print(f"⚠️ [Greeting Generation] LLM 응답이 계속 짧음 ({greeting_len}자), 재시도 실패")
+                    return greeting
             
             # 응답이 너무 길면 적절히 자르기 (100자 이내로)
-            if greeting and len(greeting) > 100:
-                import re
-                sentences = re.split(r'[.!?。]', greeting)
-                if len(sentences) > 1 and sentences[0]:
-                    greeting = sentences[0].strip() + '.'
+            if greeting_len > 100:
+                # 첫 문장 끝 위치만 찾으면 되므로 split 대신 구분자별 find로 최솟값 계산
+                end = min((pos for pos in (greeting.find(c) for c in ".!?。") if pos >= 0), default=-1)
+                if end > 0:
+                    greeting = greeting[:end].strip() + '.'
                 else:
                     greeting = greeting[:100].strip()
             
             print(f"✅ [Greeting Generation] LLM으로 멘트 생성 완료: '{greeting}' (길이: {len(greeting)}자)")
+            if greeting_cache_key:
+                await asyncio.to_thread(
+                    research_cache.set,
+                    greeting_cache_key,
+                    {"greeting": greeting},
+                    domain="general",
+                    prefix="greeting",
+                    ttl_seconds=_GREETING_CACHE_TTL_SECONDS,
+                    count_stats=False,
+                )
             return greeting
             
         except Exception as e:
@@ -113,6 +316,7 @@ async def generate_greeting_dynamically(
 async def final_report_generation(state: AgentState, config: RunnableConfig):
     """최종 리포트 생성 + Redis 캐싱 (일반 리포트, LLM 사용)"""
     
+    greeting_task = None
     try:
         # re 모듈을 함수 내에서 명시적으로 import하여 스코프 문제 해결
         import re
@@ -123,15 +327,7 @@ async def final_report_generation(state: AgentState, config: RunnableConfig):
         domain = state.get("domain", "AI 서비스")
         
         # 모델별 max_tokens 제한 확인 및 적용
-        model_name = configurable.final_report_model.lower()
-        if "gpt-4o-mini" in model_name:
-            max_tokens_allowed = min(configurable.final_report_model_max_tokens, 16384)  # gpt-4o-mini 최대 16384
-        elif "gpt-4o" in model_name and "mini" not in model_name:
-            max_tokens_allowed = min(configurable.final_report_model_max_tokens, 16384)  # gpt-4o 최대 16384
-        elif "gpt-4" in model_name:
-            max_tokens_allowed = min(configurable.final_report_model_max_tokens, 4096)  # gpt-4 최대 4096
-        else:
-            max_tokens_allowed = min(configurable.final_report_model_max_tokens, 16384)  # 기본값
+        max_tokens_allowed = _max_tokens_for(configurable.final_report_model, configurable.final_report_model_max_tokens)
         
         writer_model_config = {
             "model": configurable.final_report_model,
@@ -147,6 +343,10 @@ async def final_report_generation(state: AgentState, config: RunnableConfig):
         question_number = len(human_messages)
         is_followup = question_number > 1
         
+        # 인사 멘트는 리포트 내용과 무관하고 모든 반환 경로에서 필요하므로
+        # 리포트 생성 LLM 호출과 겹치도록 미리 시작 (필요한 시점에 await)
+        greeting_task = asyncio.create_task(generate_greeting_dynamically(messages_list, config, is_followup))
+        
         # 디버깅: findings 확인
         print(f"🔍 [DEBUG] final_report_generation 시작")
         print(f"🔍 [DEBUG] notes 개수: {len(notes)}")
@@ -155,7 +355,7 @@ async def final_report_generation(state: AgentState, config: RunnableConfig):
         print(f"🔍 [DEBUG] is_followup: {is_followup}")
         
         # findings가 비어있을 때 처리
-        if not findings or len(findings.strip()) < 50:
+        if _is_too_short(findings):
             print(f"⚠️ [DEBUG] findings가 비어있거나 너무 짧음: {len(findings)}자")
             
             # Follow-up 질문인 경우 이전 대화 내용 활용
@@ -183,7 +383,7 @@ async def final_report_generation(state: AgentState, config: RunnableConfig):
             else:
                 # 처음 질문인데 findings가 비어있으면 에러
                 # LLM으로 동적 멘트 생성
-                error_greeting = await generate_greeting_dynamically(messages_list, config, is_followup)
+                error_greeting = await greeting_task
                 if not error_greeting or len(error_greeting) < 20:
                     # LLM 생성 실패 시 질문 기반 최소 생성
                     last_user_message = messages_list[-1].content if messages_list and isinstance(messages_list[-1], HumanMessage) else ""
@@ -217,65 +417,48 @@ async def final_report_generation(state: AgentState, config: RunnableConfig):
                 if isinstance(msg, AIMessage) and hasattr(msg, 'content'):
                     content = str(msg.content)
                     # 다양한 패턴으로 도구명 추출
-                    # 패턴 1: 📊 [도구명]
-                    tools_found = re.findall(r'📊\s+([^\n]+)', content)
-                    if tools_found:
-                        all_tools.extend([t.strip() for t in tools_found])
-                    # 패턴 2: ## 📊 [도구명]
-                    tools_found2 = re.findall(r'##\s+📊\s+([^\n]+)', content)
-                    if tools_found2:
-                        all_tools.extend([t.strip() for t in tools_found2])
+                    if "📊" in content:
+                        # 패턴 1: 📊 [도구명]
+                        all_tools.extend(t.strip() for t in _RE_FOLLOWUP_EMOJI.findall(content))
+                        # 패턴 2: ## 📊 [도구명]
+                        if "##" in content:
+                            all_tools.extend(t.strip() for t in _RE_FOLLOWUP_HEADER.findall(content))
                     # 패턴 3: **1순위: [도구명]**, **2순위: [도구명]**
-                    tools_found3 = re.findall(r'\*\*[0-9]+순위:\s*([^\*]+)\*\*', content)
-                    if tools_found3:
-                        all_tools.extend([t.strip() for t in tools_found3])
+                    if "순위:" in content:
+                        all_tools.extend(t.strip() for t in _RE_FOLLOWUP_RANK.findall(content))
                     # 패턴 4: **최종 추천: [도구명]**
-                    tools_found4 = re.findall(r'\*\*최종 추천:\s*([^\*]+)\*\*', content)
-                    if tools_found4:
-                        all_tools.extend([t.strip() for t in tools_found4])
+                    if "최종 추천:" in content:
+                        all_tools.extend(t.strip() for t in _RE_FOLLOWUP_FINAL.findall(content))
                     # 패턴 5: "가장 추천하는 도구: [도구명]" 또는 "추천하는 도구: [도구명]"
-                    tools_found5 = re.findall(r'(?:가장\s+)?추천하는\s+도구:\s*([^\n\.]+)', content)
-                    if tools_found5:
-                        for tool in tools_found5:
-                            # 불필요한 문자 제거 (괄호, 기타 특수문자)
-                            tool_clean = re.sub(r'[\(\)\[\]월\s\$0-9/]+$', '', tool.strip()).strip()
-                            if tool_clean and len(tool_clean) > 2:
-                                all_tools.append(tool_clean)
                     # 패턴 5-1: "대안 1: [도구명]", "대안 2: [도구명]" 등
-                    tools_found5_1 = re.findall(r'대안\s*([0-9]+):\s*([^\n\.]+)', content)
-                    if tools_found5_1:
-                        for order_str, tool in tools_found5_1:
-                            if tool.strip():
-                                tool_clean = re.sub(r'[\(\)\[\]월\s\$0-9/]+$', '', tool.strip()).strip()
-                                if tool_clean and len(tool_clean) > 2:
+                    for marker, pattern in (("추천하는", _RE_FOLLOWUP_RECOMMENDED), ("대안", _RE_FOLLOWUP_ALTERNATIVE)):
+                        if marker in content:
+                            for tool in pattern.findall(content):
+                                # 불필요한 문자 제거 (괄호, 기타 특수문자)
+                                tool_clean = _RE_TOOL_TRAILING.sub('', tool.strip()).strip()
+                                if len(tool_clean) > 2:
                                     all_tools.append(tool_clean)
                     # 패턴 6: "💡 추천 도구" 또는 "💡 맞춤 추천" 섹션의 도구명
                     if "💡" in content and "추천" in content:
                         # 섹션 내에서 도구명 찾기 (더 구체적인 패턴)
-                        recommendation_section = re.search(r'💡[^\n]*(?:추천[^\n]*)', content, re.MULTILINE)
+                        recommendation_section = _RE_FOLLOWUP_REC_SECTION.search(content)
                         if recommendation_section:
                             section_content = recommendation_section.group(0)
                             # "가장 추천하는 도구: [도구명]" 패턴 다시 확인
-                            tools_found6 = re.findall(r'가장\s+추천하는\s+도구:\s*([^\n\.]+)', section_content)
+                            tools_found6 = _RE_FOLLOWUP_BEST.findall(section_content)
                             for tool in tools_found6:
-                                tool_clean = re.sub(r'[\(\)\[\]월\s\$0-9/]+$', '', tool.strip()).strip()
+                                tool_clean = _RE_TOOL_TRAILING.sub('', tool.strip()).strip()
                                 if tool_clean and len(tool_clean) > 2:
                                     all_tools.append(tool_clean)
                             # GitHub Copilot, Cursor 같은 도구명 패턴 찾기 (섹션 내에서만)
-                            tool_names_in_recommendation = re.findall(r'\b(GitHub\s+Copilot|Cursor|Codeium|Tabnine|Aider|Replit|Cline|Windsurf|CodeRabbit|DeepCode|JetBrains\s+AI\s+Assistant|CodeAnt|Qodo|Codacy)\b', section_content, re.IGNORECASE)
+                            tool_names_in_recommendation = _RE_FOLLOWUP_TOOL_NAMES.findall(section_content)
                             for tool_name in tool_names_in_recommendation:
                                 if tool_name.strip():
                                     all_tools.append(tool_name.strip())
             
-            # 중복 제거하고 순서 유지
-            seen = set()
-            unique_tools = []
-            for tool in all_tools:
-                # 도구명 정제 (불필요한 문자 제거)
-                tool_clean = re.sub(r'[\(\)\[\]월\s\$0-9]+', '', tool).strip()
-                if tool_clean and tool_clean not in seen and len(tool_clean) > 2:
-                    seen.add(tool_clean)
-                    unique_tools.append(tool_clean)
+            # 도구명 정제 (불필요한 문자 제거) 후 중복 제거하고 순서 유지 (dict는 삽입 순서 보존)
+            cleaned_tools = (_RE_TOOL_NOISE.sub('', tool).strip() for tool in all_tools)
+            unique_tools = list(dict.fromkeys(tool for tool in cleaned_tools if len(tool) > 2))
             
             previous_tools = ", ".join(unique_tools[:10])  # 최대 10개
             print(f"🔍 [DEBUG] final_report - 이전 추천 도구 추출: {previous_tools}")
@@ -289,29 +472,8 @@ async def final_report_generation(state: AgentState, config: RunnableConfig):
         constraints = state.get("constraints", {})
         print(f"🔍 [DEBUG] final_report - 제약 조건: {constraints}")
         
-        # 제약 조건을 문자열로 포맷팅
-        constraints_text = ""
-        if constraints:
-            constraints_text = "**🚨 하드 제약 조건 (반드시 준수해야 함):**\n\n"
-            if constraints.get("budget_max"):
-                constraints_text += f"- 최대 예산: {constraints['budget_max']:,}원\n"
-            if constraints.get("security_required"):
-                constraints_text += f"- 보안/프라이버시: 필수 (외부 서버 전송 금지)\n"
-            if constraints.get("excluded_tools"):
-                constraints_text += f"- **제외할 도구 (절대 추천 금지)**: {', '.join(constraints['excluded_tools'])}\n"
-            if constraints.get("excluded_features"):
-                constraints_text += f"- **금지된 기능**: {', '.join(constraints['excluded_features'])}\n"
-            if constraints.get("team_size"):
-                constraints_text += f"- 팀 규모: {constraints['team_size']}명\n"
-            if constraints.get("must_support_ide"):
-                constraints_text += f"- 필수 지원 IDE: {', '.join(constraints['must_support_ide'])}\n"
-            if constraints.get("must_support_language"):
-                constraints_text += f"- 필수 지원 언어: {', '.join(constraints['must_support_language'])}\n"
-            if constraints.get("other_requirements"):
-                constraints_text += f"- 기타 요구사항: {', '.join(constraints['other_requirements'])}\n"
-            constraints_text += "\n**⚠️ 중요**: 위 제약 조건을 위반하는 도구는 추천 목록에서 완전히 제외해야 합니다. 단순히 언급하거나 설명만 하는 것이 아니라, 아예 추천하지 마세요.\n"
-        else:
-            constraints_text = "제약 조건 없음"
+        # 제약 조건을 문자열로 포맷팅 (같은 세션의 Follow-up은 제약 조건이 그대로이므로 캐시 재사용)
+        constraints_text = _constraints_text_for(constraints)
         
         # 🚨 Decision Engine은 run_decision_engine 노드에서 실행되므로 여기서는 실행하지 않음
         # Decision Engine 결과가 있으면 사용, 없으면 일반 리포트 생성 (Discovery 질문용)
@@ -496,7 +658,7 @@ async def final_report_generation(state: AgentState, config: RunnableConfig):
             print(f"⚠️ [DEBUG] 리포트가 비어있거나 너무 짧음: {len(report_content)}자")
             print(f"⚠️ [DEBUG] 리포트 전체 내용: {repr(report_content)}")
             # LLM으로 동적 멘트 생성
-            error_greeting = await generate_greeting_dynamically(messages_list, config, is_followup)
+            error_greeting = await greeting_task
             if not error_greeting or len(error_greeting) < 20:
                 # LLM 생성 실패 시 질문 기반 최소 생성
                 last_user_message = messages_list[-1].content if messages_list and isinstance(messages_list[-1], HumanMessage) else ""
@@ -545,33 +707,25 @@ async def final_report_generation(state: AgentState, config: RunnableConfig):
                 # 🚨 캐시 저장 전에 [GREETING] 태그 제거 (리포트 본문만 저장)
                 content_to_cache = report_content.strip()
                 if "[GREETING]" in content_to_cache and "[/GREETING]" in content_to_cache:
-                    match = re.search(r'\[GREETING\](.*?)\[/GREETING\]', content_to_cache, re.DOTALL)
+                    match = _RE_GREETING_BLOCK.search(content_to_cache)
                     if match:
                         content_to_cache = content_to_cache.replace(match.group(0), "").strip()
                         print(f"✅ [캐시 저장] [GREETING] 태그 제거 후 리포트 본문만 저장: {len(content_to_cache)}자")
                 
-                research_cache.set(
-                    cache_key,
-                    {"content": content_to_cache},
-                    domain=domain,
-                    prefix="final"
-                )
-                print(f"✅ [캐시 저장] 최종 답변 저장 완료 (캐시키: {cache_key[:16]}..., TTL: 7일)")
-                
-                # ========== 🆕 질문-캐시 키 매핑을 벡터 DB에 저장 (유사 질문 검색용) ==========
+                # ========== 🆕 최종 답변 + 질문-캐시 키 매핑 저장 (유사 질문 검색용) ==========
                 # 원본 질문 가져오기
                 messages_list = state.get("messages", [])
                 last_user_message = messages_list[-1].content if messages_list and isinstance(messages_list[-1], HumanMessage) else ""
                 
-                if last_user_message:
-                    vector_store.add_query_mapping(
-                        query=last_user_message,
-                        cache_key=cache_key,
-                        normalized_text=normalized_query.get("normalized_text", ""),
-                        domain=domain,
-                        ttl_days=7
-                    )
-                    print(f"✅ [벡터 DB 저장] 질문-캐시 키 매핑 저장 완료 (질문: '{last_user_message[:50]}...')")
+                # Redis/벡터 DB 저장은 백그라운드에서 동시에 실행 (응답 반환을 지연시키지 않음)
+                # (저장 완료 전에 같은 질문이 바로 다시 오면 캐시 MISS로 새로 생성됨)
+                _schedule_final_report_persist(
+                    cache_key=cache_key,
+                    content=content_to_cache,
+                    domain=domain,
+                    last_user_message=last_user_message,
+                    normalized_text=normalized_query.get("normalized_text", "")
+                )
             else:
                 print(f"⚠️ [캐시 저장 실패] normalized_query 없음: {normalized_query}")
         else:
@@ -609,7 +763,7 @@ async def final_report_generation(state: AgentState, config: RunnableConfig):
         
         if "[GREETING]" in report_content and "[/GREETING]" in report_content:
             # 태그와 내용을 추출 (여러 줄 포함)
-            match = re.search(r'\[GREETING\](.*?)\[/GREETING\]', report_content, re.DOTALL)
+            match = _RE_GREETING_BLOCK.search(report_content)
             if match:
                 greeting = match.group(1).strip()
                 # 태그 전체를 제거하고 나머지를 리포트로
@@ -637,7 +791,7 @@ async def final_report_generation(state: AgentState, config: RunnableConfig):
         else:
             print(f"✅ [DEBUG] GREETING 태그 없음 - LLM으로 동적 멘트 생성")
         # LLM으로 동적으로 멘트 생성 (공통 함수 사용)
-        greeting = await generate_greeting_dynamically(messages_list, config, is_followup)
+        greeting = await greeting_task
         if not greeting or len(greeting) < 20:
             # LLM 생성 실패 시 질문 기반 최소 생성
             last_user_message = messages_list[-1].content if messages_list and isinstance(messages_list[-1], HumanMessage) else ""
@@ -665,7 +819,11 @@ async def final_report_generation(state: AgentState, config: RunnableConfig):
         traceback.print_exc()
         
         # 에러 발생 시에도 LLM으로 동적 멘트 생성
-        error_greeting = await generate_greeting_dynamically(messages_list, config, is_followup)
+        error_greeting = (
+            await greeting_task
+            if greeting_task is not None
+            else await generate_greeting_dynamically(messages_list, config, is_followup)
+        )
         if not error_greeting or len(error_greeting) < 20:
             # LLM 생성 실패 시 질문 기반 최소 생성
             last_user_message = messages_list[-1].content if messages_list and isinstance(messages_list[-1], HumanMessage) else ""
@@ -960,15 +1118,11 @@ async def structured_report_generation(state: AgentState, config: RunnableConfig
     
     # LLM으로 리포트 생성
     # 모델별 max_tokens 제한 확인 및 적용
-    model_name = configurable.final_report_model.lower()
-    if "gpt-4o-mini" in model_name:
-        max_tokens_allowed = min(configurable.final_report_model_max_tokens, 16384)  # gpt-4o-mini 최대 16384
-    elif "gpt-4o" in model_name:
-        max_tokens_allowed = min(configurable.final_report_model_max_tokens, 4096)  # gpt-4o 최대 4096 (일반적으로)
-    elif "gpt-4" in model_name:
-        max_tokens_allowed = min(configurable.final_report_model_max_tokens, 4096)  # gpt-4 최대 4096
-    else:
-        max_tokens_allowed = min(configurable.final_report_model_max_tokens, 16384)  # 기본값
+    max_tokens_allowed = _max_tokens_for(
+        configurable.final_report_model,
+        configurable.final_report_model_max_tokens,
+        _STRUCTURED_MODEL_MAX_TOKENS,
+    )
     
     writer_model_config = {
         "model": configurable.final_report_model,
@@ -1069,7 +1223,7 @@ async def structured_report_generation(state: AgentState, config: RunnableConfig
                     
                     # [GREETING] 태그 제거 (final_report_generation과 동일한 로직)
                     if "[GREETING]" in report_body and "[/GREETING]" in report_body:
-                        match = re.search(r'\[GREETING\](.*?)\[/GREETING\]', report_body, re.DOTALL)
+                        match = _RE_GREETING_BLOCK.search(report_body)
                         if match:
                             report_body = report_body.replace(match.group(0), "").strip()
                     
@@ -1483,33 +1637,24 @@ async def structured_report_generation(state: AgentState, config: RunnableConfig
                 # 🚨 캐시 저장 전에 [GREETING] 태그 제거 (리포트 본문만 저장)
                 content_to_cache = report_body.strip()
                 if "[GREETING]" in content_to_cache and "[/GREETING]" in content_to_cache:
-                    match = re.search(r'\[GREETING\](.*?)\[/GREETING\]', content_to_cache, re.DOTALL)
+                    match = _RE_GREETING_BLOCK.search(content_to_cache)
                     if match:
                         content_to_cache = content_to_cache.replace(match.group(0), "").strip()
                         print(f"✅ [캐시 저장] [GREETING] 태그 제거 후 리포트 본문만 저장: {len(content_to_cache)}자")
                 
-                research_cache.set(
-                    cache_key,
-                    {"content": content_to_cache},
-                    domain=domain,
-                    prefix="final"
-                )
-                print(f"✅ [캐시 저장] 구조화된 리포트 저장 완료")
-                
-                # ========== 🆕 질문-캐시 키 매핑을 벡터 DB에 저장 (유사 질문 검색용) ==========
+                # ========== 🆕 구조화된 리포트 + 질문-캐시 키 매핑 저장 (유사 질문 검색용) ==========
                 messages_list = state.get("messages", [])
                 last_user_message = messages_list[-1].content if messages_list and isinstance(messages_list[-1], HumanMessage) else ""
                 
-                if last_user_message:
-                    # _common.py에서 이미 import한 vector_store 사용
-                    vector_store.add_query_mapping(
-                        query=last_user_message,
-                        cache_key=cache_key,
-                        normalized_text=normalized_query.get("normalized_text", ""),
-                        domain=domain,
-                        ttl_days=7
-                    )
-                    print(f"✅ [벡터 DB 저장] 질문-캐시 키 매핑 저장 완료 (structured_report, 질문: '{last_user_message[:50]}...')")
+                # Redis/벡터 DB 저장은 백그라운드에서 동시에 실행 (응답 반환을 지연시키지 않음)
+                # (저장 완료 전에 같은 질문이 바로 다시 오면 캐시 MISS로 새로 생성됨)
+                _schedule_final_report_persist(
+                    cache_key=cache_key,
+                    content=content_to_cache,
+                    domain=domain,
+                    last_user_message=last_user_message,
+                    normalized_text=normalized_query.get("normalized_text", "")
+                )
         else:
             if not need_research:
                 print(f"✅ [캐시 저장 건너뛰기] 재검색 불필요 (need_research = false) - 이전 대화 정보만 사용했으므로 저장하지 않음")
@@ -5,10 +5,11 @@ from app.agent.prompts.utils import (
     get_today_str,
     get_current_year,
     get_current_month_year,
+    get_date_context,
 )
 
 # 도메인 가이드
-from app.agent.prompts.domain import DOMAIN_GUIDES
+from app.agent.prompts.domain import DOMAIN_GUIDES, format_domain_guide
 
 # 프롬프트 템플릿
 from app.agent.prompts.clarify import clarify_with_user_instructions
@@ -27,7 +28,9 @@ __all__ = [
     "get_today_str",
     "get_current_year",
     "get_current_month_year",
+    "get_date_context",
     "DOMAIN_GUIDES",
+    "format_domain_guide",
     "clarify_with_user_instructions",
     "transform_messages_into_research_topic_prompt",
     "lead_researcher_prompt",
@@ -392,7 +392,8 @@ JSON 형식으로 응답:
   "need_research": true/false (is_followup = YES인 경우만 판단, 처음 질문이면 항상 true),
   "question": "명확화 질문 (need_clarification이 true인 경우만) - ⚠️ 반드시 자연스러운 줄글 형식으로 작성! 리스트/불릿 포인트 절대 금지!",
   "verification": "연구 시작 확인 메시지 (주제가 맞고 명확화가 불필요한 경우)",
-  "off_topic_message": "주제에서 벗어난 경우 거부 메시지 (is_on_topic이 false인 경우만)"
+  "off_topic_message": "주제에서 벗어난 경우 거부 메시지 (is_on_topic이 false인 경우만)",
+  "dynamic_greeting": "저장된 답변 앞에 붙일 인사 멘트 (주제가 맞는 경우만, 40-100자)"
 }}
 
 **⚠️ 매우 중요 - question 필드 작성 시:**
@@ -411,6 +412,7 @@ JSON 형식으로 응답:
 - **인사가 아닌 경우 (is_greeting = false):**
   - is_on_topic = false이면: off_topic_message만 채우고 나머지는 빈 문자열
   - is_on_topic = true이면: verification 또는 question을 채우고 off_topic_message는 빈 문자열
+  - is_on_topic = true이면: dynamic_greeting도 채우세요 (질문의 핵심 내용(팀 규모, 목적, 요구사항 등)을 구체적으로 반영한 40-100자 정도의 인사 멘트, [GREETING] 태그 없이)
   - greeting_message는 빈 문자열
 """
 
@@ -1,5 +1,7 @@
 """도메인별 가이드"""
 
+from functools import lru_cache
+
 # 코딩 AI 도구 추천 가이드 (개인/팀 모두 지원)
 DOMAIN_GUIDES = {
     "코딩": """
@@ -98,3 +100,21 @@ DOMAIN_GUIDES = {
 """
 }
 
+
+@lru_cache(maxsize=32)
+def format_domain_guide(
+    domain: str, date: str, current_year: str, current_month_year: str
+) -> str:
+    """도메인 가이드 날짜 변수 포맷팅 (날짜는 하루 단위로만 바뀌므로 결과 캐싱)"""
+    domain_guide = DOMAIN_GUIDES.get(domain, "")
+    # 포맷팅 변수가 없으면 그대로 사용
+    if "{" not in domain_guide:
+        return domain_guide
+    try:
+        return domain_guide.format(
+            date=date,
+            current_year=current_year,
+            current_month_year=current_month_year
+        )
+    except KeyError:
+        return domain_guide
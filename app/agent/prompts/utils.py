@@ -1,6 +1,9 @@
 """유틸리티 함수 - 날짜 관련"""
 
+import time
 from datetime import datetime
+from functools import lru_cache
+from typing import Tuple
 
 
 def get_today_str() -> str:
@@ -23,3 +26,14 @@ def get_current_month_year() -> str:
     now = datetime.now()
     return f"{month_names[now.month]} {now.year}"
 
+
+
+@lru_cache(maxsize=1)
+def _date_context_for_minute(minute_bucket: int) -> Tuple[str, str, str]:
+    """분 단위 버킷별 날짜 문자열 묶음 (같은 분 안의 요청은 캐시된 값을 재사용)"""
+    return get_today_str(), get_current_year(), get_current_month_year()
+
+
+def get_date_context() -> Tuple[str, str, str]:
+    """(오늘 날짜, 현재 연도, 현재 월/연도) 문자열 - 분 단위로 캐싱"""
+    return _date_context_for_minute(int(time.time() // 60))
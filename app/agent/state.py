@@ -57,6 +57,10 @@ class ClarifyWithUser(BaseModel):
         description="주제에서 벗어난 경우 사용자에게 보낼 거부 메시지",
         default="죄송합니다. 저는 코딩 AI 도구 추천을 전문으로 하는 어시스턴트입니다. 다시 말씀해주세요!",
     )
+    dynamic_greeting: str = Field(
+        description="저장된 답변을 재사용할 때 앞에 붙일 인사 멘트 (주제가 맞는 경우, 질문 내용을 반영한 40-100자)",
+        default="",
+    )
 
 
 class TableData(BaseModel):
@@ -164,6 +168,9 @@ class AgentState(MessagesState):
     tool_facts: Annotated[List[dict], override_reducer] = []  # 구조화된 도구 사실 (Fact Model)
     decision_result: Optional[dict] = None  # 판단 결과 (DecisionResult)
     previous_tools_ordered: Optional[List[str]] = None  # 이전 추천 도구 순서 (Follow-up 질문 처리용)
+    previous_tools: Optional[List[str]] = None  # 직전 리포트에서 추출한 추천 도구 (clarify 캐시 검증용, 호출자가 대화 이력에서 구성)
+    human_message_count: Optional[int] = None  # 사용자 메시지 개수 (호출자가 대화 이력 구성 시 계산, 없으면 노드에서 직접 셈)
+    user_messages_lower: Optional[List[str]] = None  # 사용자 메시지 소문자 목록 (라우팅 키워드 검사용, 호출자가 구성)
     response_format: Optional[str] = None  # 답변 형식 요청 (table, list, markdown 등)
 
 
@@ -2,11 +2,21 @@ from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 from app.routes.chat import router as chat_router
 from dotenv import load_dotenv
+import logging
 import os
 
 # .env 파일 로드
 load_dotenv()
 
+# 로깅 설정: 루트는 INFO로 두고 DEBUG=true면 app 로거만 상세 디버그 로그 출력
+# (루트를 DEBUG로 올리면 httpx/openai/qdrant 등이 사용자 메시지·프롬프트가 담긴 요청 내용까지 기록함)
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+)
+if os.getenv("DEBUG", "false").lower() == "true":
+    logging.getLogger("app").setLevel(logging.DEBUG)
+
 app = FastAPI(title="AI Agent Chat")
 
 
@@ -7,6 +7,7 @@ import os
 import time
 
 from app.agent.graph import deep_researcher
+from app.agent.nodes.writer import extract_recommended_tools
 from app.tools.cache import research_cache
 
 
@@ -52,16 +53,32 @@ async def chat(req: ChatRequest):
         
         # 대화 이력 구성
         messages_to_send = []
+        # 사용자 메시지 소문자 목록 (노드마다 메시지 이력을 다시 훑지 않도록 여기서 한 번만 구성)
+        user_messages_lower = []
+        # 어시스턴트 답변 본문 (직전 추천 도구 추출용)
+        assistant_contents = []
         
         # 이전 대화 이력 추가
         for msg in req.history:
             if msg.get("role") == "user":
-                messages_to_send.append(HumanMessage(content=msg.get("content", "")))
+                content = msg.get("content", "")
+                messages_to_send.append(HumanMessage(content=content))
+                user_messages_lower.append(str(content).lower())
             elif msg.get("role") == "assistant":
-                messages_to_send.append(AIMessage(content=msg.get("content", "")))
+                content = msg.get("content", "")
+                messages_to_send.append(AIMessage(content=content))
+                assistant_contents.append(str(content))
         
         # 현재 사용자 메시지 추가
         messages_to_send.append(HumanMessage(content=req.message))
+        user_messages_lower.append(req.message.lower())
+        
+        # 직전 추천 도구: 도구가 발견된 가장 최근 어시스턴트 답변 하나만 사용 (clarify 캐시 검증 기준)
+        previous_tools = []
+        for content in reversed(assistant_contents):
+            previous_tools = extract_recommended_tools(content)
+            if previous_tools:
+                break
         
         print(f"🔍 [DEBUG] chat.py - 전송할 Messages 개수: {len(messages_to_send)}개")
         
@@ -69,7 +86,10 @@ async def chat(req: ChatRequest):
         result = await deep_researcher.ainvoke(
             {
                 "messages": messages_to_send,
-                "domain": domain
+                "domain": domain,
+                "human_message_count": len(user_messages_lower),
+                "user_messages_lower": user_messages_lower,
+                "previous_tools": previous_tools,
             },
             config={
                 "configurable": {
@@ -3,6 +3,9 @@
 import hashlib
 import json
 import os
+import threading
+import time
+from collections import OrderedDict
 from typing import Optional, Dict, Any
 import redis
 from redis.exceptions import RedisError
@@ -74,7 +77,7 @@ class RedisCache:
         
         return None
     
-    def set(self, query: str, result: Dict[str, Any], domain: str = "general", prefix: str = "answer", ttl_seconds: Optional[int] = None):
+    def set(self, query: str, result: Dict[str, Any], domain: str = "general", prefix: str = "answer", ttl_seconds: Optional[int] = None, count_stats: bool = True):
         """
         캐시에 저장
         
@@ -84,6 +87,7 @@ class RedisCache:
             domain: 도메인
             prefix: 접두사 (answer / query / search)
             ttl_seconds: 사용자 정의 TTL (None이면 자동 선택)
+            count_stats: False면 cache_count 통계를 증가시키지 않음 (인사 멘트 등 부가 데이터용)
         """
         key = self._get_key(query, domain, prefix)
         
@@ -99,11 +103,13 @@ class RedisCache:
                 self.redis.setex(
                     key,
                     ttl_seconds,
-                    json.dumps(result, ensure_ascii=False)
+                    # 공백 없는 구분자로 직렬화 (보고서 본문 저장 시 크기/인코딩 비용 절감)
+                    json.dumps(result, ensure_ascii=False, separators=(",", ":"))
                 )
                 # 통계 업데이트
-                stats_key = f"ai-agent:stats:cache_count"
-                self.redis.incr(stats_key)
+                if count_stats:
+                    stats_key = f"ai-agent:stats:cache_count"
+                    self.redis.incr(stats_key)
                 # 로그는 chat.py에서 출력하므로 여기서는 생략
             except (RedisError, TypeError) as e:
                 print(f"⚠️ Redis 저장 오류: {e}")
@@ -149,6 +155,48 @@ class RedisCache:
             print(f"🗑️ 메모리 전체 캐시 삭제: {count}개")
 
 
+class LocalTTLCache:
+    """프로세스 내 L0 캐시 (LRU + TTL, Redis/Qdrant 왕복 전에 조회)"""
+    
+    def __init__(self, maxsize: int = 512, ttl_seconds: float = 60):
+        """
+        Args:
+            maxsize: 최대 항목 수 (초과 시 가장 오래 사용하지 않은 항목부터 제거)
+            ttl_seconds: 항목 유효 시간 (초)
+        """
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._data: "OrderedDict[Any, tuple]" = OrderedDict()
+        # asyncio.to_thread 워커에서도 호출되므로 잠금 필요
+        self._lock = threading.Lock()
+    
+    def get(self, key: Any) -> Optional[Any]:
+        """만료되지 않은 값 반환 (없으면 None)"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+    
+    def set(self, key: Any, value: Any):
+        """값 저장"""
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+    
+    def clear(self):
+        """모든 항목 삭제"""
+        with self._lock:
+            self._data.clear()
+
+
 # 전역 캐시 인스턴스
 research_cache = RedisCache(search_ttl_hours=24, answer_ttl_hours=168)  # 검색 24h, 답변 7일
 
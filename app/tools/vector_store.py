@@ -11,6 +11,7 @@ from qdrant_client.models import (
     Filter,
     FieldCondition,
     Range,
+    SearchParams,
 )
 from sentence_transformers import SentenceTransformer
 import hashlib
@@ -36,6 +37,8 @@ class VectorStore:
         """
         self.collection_name = collection_name
         self.query_collection_name = query_collection_name
+        # Facts 컬렉션 변경 버전 (add_facts 성공 시 증가 → 검색 결과 캐시 무효화용)
+        self.version = 0
         
         # Qdrant 클라이언트 초기화
         qdrant_url = qdrant_url or os.getenv("QDRANT_URL", "localhost")
@@ -191,6 +194,7 @@ class VectorStore:
                 collection_name=self.collection_name,
                 points=points
             )
+            self.version += 1
             print(f"✅ Vector DB 저장 완료: {len(points)}개 facts (TTL={ttl_days}일)")
             return True
         
@@ -206,6 +210,7 @@ class VectorStore:
                         collection_name=self.collection_name,
                         points=points
                     )
+                    self.version += 1
                     print(f"✅ Vector DB 저장 완료 (재시도 성공): {len(points)}개 facts")
                     return True
                 except Exception as retry_e:
@@ -219,7 +224,8 @@ class VectorStore:
         self,
         query: str,
         limit: int = 5,
-        score_threshold: float = 0.7
+        score_threshold: float = 0.7,
+        hnsw_ef: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """
         유사한 Facts 검색
@@ -228,6 +234,7 @@ class VectorStore:
             query: 검색 쿼리
             limit: 최대 결과 개수
             score_threshold: 최소 유사도 (0~1)
+            hnsw_ef: HNSW 탐색 폭 (클수록 재현율↑, 지연↑ / None이면 컬렉션 기본값)
         
         Returns:
             검색 결과 리스트 [{"text": "...", "score": 0.9, ...}, ...]
@@ -248,6 +255,7 @@ class VectorStore:
                 query_vector=query_embedding,
                 limit=limit,
                 score_threshold=score_threshold,
+                search_params=SearchParams(hnsw_ef=hnsw_ef) if hnsw_ef else None,
                 query_filter=Filter(
                     must=[
                         FieldCondition(